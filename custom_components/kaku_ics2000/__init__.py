@@ -21,6 +21,7 @@ from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.event import async_track_time_change
@@ -40,6 +41,8 @@ from .const import (
     DEFAULT_SLEEP,
     DEFAULT_SHOW_SCENES,
     DOMAIN,
+    MANUFACTURER,
+    REFRESH_DEBOUNCE,
     SERVICE_IDENTIFY,
     SERVICE_REFRESH_DEVICES,
     SERVICE_RESET_STATE,
@@ -115,6 +118,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         name=f"ICS-2000 ({entry.data[CONF_MAC]})",
         update_method=async_update_data,
         update_interval=timedelta(seconds=30),
+        # Collapse bursts of turn_on/turn_off refresh requests into one sync
+        request_refresh_debouncer=Debouncer(
+            hass, _LOGGER, cooldown=REFRESH_DEBOUNCE, immediate=False
+        ),
     )
     
     # Fetch initial data
@@ -132,7 +139,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     device_registry.async_get_or_create(
         config_entry_id=entry.entry_id,
         identifiers={(DOMAIN, hub.mac)},
-        manufacturer="KlikAanKlikUit",
+        manufacturer=MANUFACTURER,
         model="ICS-2000",
         name=f"ICS-2000 ({hub.mac[-6:]})",
         sw_version=hub.firmware_version,
@@ -0,0 +1,100 @@
+"""
+Shared cloud helpers for the ICS-2000 diagnostic scripts
+Login, sync and a pooled, retrying form POST used by the test_*.py scripts
+"""
+
+import json
+import ssl
+import http.client
+import threading
+import time
+import urllib.parse
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional
+    json_loads = json.loads
+
+ACCOUNT_URL = "https://trustsmartcloud2.com/ics2000_api/account.php"
+GATEWAY_URL = "https://trustsmartcloud2.com/ics2000_api/gateway.php"
+
+# One SSL context for every request; certificates are not verified (for testing)
+SSL_CTX = ssl.create_default_context()
+SSL_CTX.check_hostname = False
+SSL_CTX.verify_mode = ssl.CERT_NONE
+
+# Keep-alive connections, keyed by (thread, host, timeout) since
+# http.client connections must not be shared between threads
+_connections = {}
+
+# Short connect timeout, retries with backoff for transient failures
+CONNECT_TIMEOUT = 2.0
+RETRIES = 2
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = frozenset((502, 503, 504))
+
+def post_form(url, fields, timeout=10):
+    """POST form fields (a dict or an encoded body) and return the body text."""
+    parts = urllib.parse.urlsplit(url)
+    key = (threading.get_ident(), parts.netloc, timeout)
+    conn = _connections.get(key)
+    if conn is None:
+        conn = _connections[key] = http.client.HTTPSConnection(
+            parts.netloc, context=SSL_CTX, timeout=CONNECT_TIMEOUT
+        )
+    
+    body = fields if isinstance(fields, (str, bytes)) else urllib.parse.urlencode(fields)
+    headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+    for attempt in range(RETRIES + 1):
+        try:
+            # Connect with the short timeout, then allow the full read timeout
+            if conn.sock is None:
+                conn.connect()
+                conn.sock.settimeout(timeout)
+            
+            conn.request('POST', parts.path, body=body, headers=headers)
+            response = conn.getresponse()
+            text = response.read().decode('utf-8')
+            if response.status not in RETRY_STATUSES or attempt == RETRIES:
+                return text
+        except (OSError, http.client.HTTPException):
+            # Drop the broken connection; the next attempt reconnects
+            conn.close()
+            if attempt == RETRIES:
+                raise
+        
+        time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+def close_connections():
+    """Close all pooled connections."""
+    for conn in _connections.values():
+        conn.close()
+    _connections.clear()
+
+def login(email, password):
+    """Log in to the cloud and return the first home, or None if there is none."""
+    auth_data = json_loads(post_form(ACCOUNT_URL, {
+        'action': 'login',
+        'email': email,
+        'password_hash': password,
+        'device_unique_id': 'android',
+        'platform': '',
+        'mac': '',
+    }))
+    
+    homes = auth_data.get('homes')
+    return homes[0] if homes else None
+
+def encode_sync(email, password, home):
+    """Encode the sync request for a home once, so it can be sent repeatedly."""
+    return urllib.parse.urlencode({
+        'email': email,
+        'mac': home['mac'],
+        'action': 'sync',
+        'password_hash': password,
+        'home_id': home['home_id'],
+    })
+
+def sync(sync_body):
+    """Send an encoded sync request and return the decoded response."""
+    return json_loads(post_form(GATEWAY_URL, sync_body))
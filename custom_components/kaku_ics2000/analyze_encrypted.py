@@ -6,6 +6,10 @@ Simple analysis of the encrypted data to understand its structure
 import base64
 import json
 
+# Bytes that can start a JSON value; `data[i] in JSON_OPENERS` checks an int
+# without slicing out a one-byte bytes object per offset
+JSON_OPENERS = b'{["'
+
 def analyze_data():
     """Analyze the encrypted data structure."""
     
@@ -36,11 +40,11 @@ def analyze_data():
     
     # Check if it starts with common JSON characters after some offset
     for offset in range(16):
-        if status_bytes[offset:offset+1] in [b'{', b'[', b'"']:
+        if status_bytes[offset] in JSON_OPENERS:
             print(f"Possible JSON at offset {offset} in status: {status_bytes[offset:offset+20]}")
     
     for offset in range(16):
-        if data_bytes[offset:offset+1] in [b'{', b'[', b'"']:
+        if data_bytes[offset] in JSON_OPENERS:
             print(f"Possible JSON at offset {offset} in data: {data_bytes[offset:offset+20]}")
     
     # Try to find text patterns
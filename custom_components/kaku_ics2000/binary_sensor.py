@@ -29,6 +29,7 @@ from .const import (
     DEVICE_TYPE_SENSOR,
     DEVICE_TYPE_DOORBELL,
     DOMAIN,
+    MANUFACTURER,
 )
 from .hub import ICS2000Hub
 
@@ -109,9 +110,9 @@ class KakuBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{hub.mac}_{device_id}")},
             name=self._attr_name,
-            manufacturer="KlikAanKlikUit",
+            manufacturer=MANUFACTURER,
             model=self._device.get(ATTR_DEVICE_MODEL, "Unknown"),
-            via_device=(DOMAIN, hub.mac),
+            via_device=hub.via_device,
         )
         
         # For Zigbee sensors, we don't assume state
@@ -9,6 +9,9 @@ import ssl
 import urllib.request
 import urllib.parse
 
+# Valid PKCS7 padding tails, indexed by pad length
+PKCS7_PADDING = tuple(bytes((n,)) * n for n in range(17))
+
 def decrypt_field(encrypted_b64: str, aes_key_hex: str, field_name: str):
     """Decrypt a field and show what's in it."""
     try:
@@ -26,12 +29,9 @@ def decrypt_field(encrypted_b64: str, aes_key_hex: str, field_name: str):
         decryptor = cipher.decryptor()
         decrypted = decryptor.update(encrypted) + decryptor.finalize()
         
-        # Find JSON start
-        json_start = -1
-        for i in range(len(decrypted)):
-            if decrypted[i:i+1] in [b'{', b'[']:
-                json_start = i
-                break
+        # Find JSON start with C-level searches instead of a per-byte loop
+        starts = [pos for pos in (decrypted.find(b'{'), decrypted.find(b'[')) if pos >= 0]
+        json_start = min(starts, default=-1)
         
         if json_start >= 0:
             json_bytes = decrypted[json_start:]
@@ -39,9 +39,8 @@ def decrypt_field(encrypted_b64: str, aes_key_hex: str, field_name: str):
             # Remove padding
             if len(json_bytes) > 0:
                 pad_len = json_bytes[-1]
-                if isinstance(pad_len, int) and pad_len < 16:
-                    if all(b == pad_len for b in json_bytes[-pad_len:]):
-                        json_bytes = json_bytes[:-pad_len]
+                if 0 < pad_len <= 16 and json_bytes.endswith(PKCS7_PADDING[pad_len]):
+                    json_bytes = json_bytes[:-pad_len]
             
             json_text = json_bytes.decode('utf-8', errors='ignore')
             
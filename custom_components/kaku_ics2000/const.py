@@ -119,6 +119,7 @@ UPDATE_INTERVAL = 30
 DISCOVERY_INTERVAL = 300
 PING_INTERVAL = 60
 RECONNECT_INTERVAL = 10
+REFRESH_DEBOUNCE = 2
 
 # Encryption
 ENCRYPTION_HEADER = b'kaku'
@@ -152,3 +153,6 @@ MAX_SCENES = 32
 MAX_RETRIES = 3
 MAX_NAME_LENGTH = 32
 
+# Decrypted payloads kept in memory for reuse
+DECRYPT_CACHE_SIZE = 512
+
@@ -30,6 +30,7 @@ from .const import (
     ATTR_ZIGBEE,
     DEVICE_TYPE_COVER,
     DOMAIN,
+    MANUFACTURER,
 )
 from .hub import ICS2000Hub
 
@@ -111,9 +112,9 @@ class KakuCover(CoordinatorEntity, CoverEntity):
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{hub.mac}_{device_id}")},
             name=self._attr_name,
-            manufacturer="KlikAanKlikUit",
+            manufacturer=MANUFACTURER,
             model=self._device.get(ATTR_DEVICE_MODEL, "Unknown"),
-            via_device=(DOMAIN, hub.mac),
+            via_device=hub.via_device,
         )
         
         # Set supported features
@@ -198,16 +199,22 @@ class KakuCover(CoordinatorEntity, CoverEntity):
         await self._hub.async_turn_on(self._device_id)
         await self._hub._update_device_state(self._device_id, {"position": 100})
         
-        # Request coordinator refresh
-        await self.coordinator.async_request_refresh()
+        # Refresh in the background so the service call returns immediately
+        self.hass.async_create_background_task(
+            self.coordinator.async_request_refresh(),
+            name=f"{DOMAIN} refresh {self._device_id}",
+        )
     
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
         await self._hub.async_turn_off(self._device_id)
         await self._hub._update_device_state(self._device_id, {"position": 0})
         
-        # Request coordinator refresh
-        await self.coordinator.async_request_refresh()
+        # Refresh in the background so the service call returns immediately
+        self.hass.async_create_background_task(
+            self.coordinator.async_request_refresh(),
+            name=f"{DOMAIN} refresh {self._device_id}",
+        )
     
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
@@ -215,13 +222,19 @@ class KakuCover(CoordinatorEntity, CoverEntity):
         # But we can update the assumed position to 50%
         await self._hub._update_device_state(self._device_id, {"position": 50})
         
-        # Request coordinator refresh
-        await self.coordinator.async_request_refresh()
+        # Refresh in the background so the service call returns immediately
+        self.hass.async_create_background_task(
+            self.coordinator.async_request_refresh(),
+            name=f"{DOMAIN} refresh {self._device_id}",
+        )
     
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Set the cover position."""
         position = kwargs.get(ATTR_POSITION, 50)
         await self._hub.async_set_cover_position(self._device_id, position)
         
-        # Request coordinator refresh
-        await self.coordinator.async_request_refresh()
+        # Refresh in the background so the service call returns immediately
+        self.hass.async_create_background_task(
+            self.coordinator.async_request_refresh(),
+            name=f"{DOMAIN} refresh {self._device_id}",
+        )
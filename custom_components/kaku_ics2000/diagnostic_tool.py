@@ -13,6 +13,11 @@ import urllib.parse
 import urllib.error
 from typing import Dict, List, Optional, Tuple
 
+# One SSL context for every request; certificates are not verified (for testing)
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = ssl.CERT_NONE
+
 def test_authentication(email: str, password: str, mac: str) -> Tuple[bool, Optional[Dict]]:
     """Test cloud authentication using Homebridge format."""
     
@@ -38,11 +43,6 @@ def test_authentication(email: str, password: str, mac: str) -> Tuple[bool, Opti
         "https://www.trustsmartcloud2.com/ics2000_api/account.php",
     ]
     
-    # Create SSL context that doesn't verify certificates (for testing)
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    
     for endpoint in endpoints:
         print(f"\n--- Testing endpoint: {endpoint} ---")
         
@@ -62,7 +62,7 @@ def test_authentication(email: str, password: str, mac: str) -> Tuple[bool, Opti
                 data = urllib.parse.urlencode(login_data).encode('utf-8')
                 req = urllib.request.Request(endpoint, data=data, method='POST')
                 
-                with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
+                with urllib.request.urlopen(req, context=_SSL_CTX, timeout=10) as response:
                     text = response.read().decode('utf-8')
                     print(f"  Status: {response.status}")
                     print(f"  Response preview: {text[:200]}")
@@ -146,10 +146,6 @@ def test_device_sync(email: str, password: str, mac: str, auth_data: Optional[Di
         },
     ]
     
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    
     for endpoint, endpoint_name in sync_endpoints:
         print(f"\n--- Testing {endpoint_name} ---")
         
@@ -160,7 +156,7 @@ def test_device_sync(email: str, password: str, mac: str, auth_data: Optional[Di
                 data = urllib.parse.urlencode(sync_data).encode('utf-8')
                 req = urllib.request.Request(endpoint, data=data, method='POST')
                 
-                with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
+                with urllib.request.urlopen(req, context=_SSL_CTX, timeout=10) as response:
                     text = response.read().decode('utf-8')
                     
                     if response.status == 200:
@@ -219,6 +215,7 @@ def test_local_discovery(mac: str, ip_address: Optional[str] = None) -> Optional
     discovered_ip = None
     
     # First try broadcast discovery
+    sock = None
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
@@ -245,7 +242,8 @@ def test_local_discovery(mac: str, ip_address: Optional[str] = None) -> Optional
     except Exception as e:
         print(f"❌ Discovery error: {e}")
     finally:
-        sock.close()
+        if sock is not None:
+            sock.close()
     
     # Test provided IP address if given
     if ip_address:
@@ -10,6 +10,11 @@ import urllib.request
 import urllib.parse
 import time
 
+# One SSL context for every request; certificates are not verified (for testing)
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = ssl.CERT_NONE
+
 def try_endpoint(session_data, endpoint, params, description):
     """Try an endpoint with given parameters."""
     print(f"\n{'='*50}")
@@ -17,15 +22,11 @@ def try_endpoint(session_data, endpoint, params, description):
     print(f"Endpoint: {endpoint}")
     print(f"Params: {params}")
     
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    
     try:
         data = urllib.parse.urlencode(params).encode('utf-8')
         req = urllib.request.Request(endpoint, data=data, method='POST')
         
-        with urllib.request.urlopen(req, context=ctx, timeout=5) as response:
+        with urllib.request.urlopen(req, context=_SSL_CTX, timeout=5) as response:
             if response.status == 200:
                 text = response.read().decode('utf-8')
                 
@@ -58,10 +59,6 @@ def main():
     email = input("Enter email: ").strip()
     password = input("Enter password: ").strip()
     
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    
     # Authenticate
     print("\nAuthenticating...")
     login_data = {
@@ -81,7 +78,7 @@ def main():
             method='POST'
         )
         
-        with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
+        with urllib.request.urlopen(req, context=_SSL_CTX, timeout=10) as response:
             auth_text = response.read().decode('utf-8')
             auth_data = json.loads(auth_text)
             
@@ -15,6 +15,7 @@ def test_udp_port(ip, port, message, description):
     print(f"Testing: {description}")
     print(f"Port: {port}, Message: {message}")
     
+    sock = None
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.settimeout(2)
@@ -47,7 +48,8 @@ def test_udp_port(ip, port, message, description):
         print(f"Error: {e}")
         return None
     finally:
-        sock.close()
+        if sock is not None:
+            sock.close()
 
 def test_tcp_port(ip, port, message, description):
     """Test TCP communication on a specific port."""
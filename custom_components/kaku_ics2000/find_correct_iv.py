@@ -34,10 +34,8 @@ def try_decrypt_with_iv(encrypted_data: bytes, key: bytes, iv: bytes):
 
 def find_json_start(data: bytes):
     """Find where JSON actually starts in the data."""
-    for i in range(len(data)):
-        if data[i:i+1] in [b'{', b'[']:
-            return i
-    return -1
+    starts = [pos for pos in (data.find(b'{'), data.find(b'[')) if pos >= 0]
+    return min(starts, default=-1)
 
 def main():
     print("=== Finding Correct IV for Decryption ===\n")
@@ -6,30 +6,32 @@ import asyncio
 import base64
 import json
 import logging
-import random
+import re
 import socket
 import struct
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
 
 import aiohttp
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util.json import json_loads
 
 from .const import (
     ATTR_CONFIDENCE,
-    ATTR_DEVICE_ID,
-    ATTR_DEVICE_MODEL,
-    ATTR_DEVICE_TYPE,
-    ATTR_DIMMABLE,
     ATTR_LAST_COMMAND,
     ATTR_LAST_UPDATE,
-    ATTR_ZIGBEE,
     AUTH_ENDPOINT,
     DEFAULT_PORT,
     DEFAULT_SLEEP,
     DEFAULT_TRIES,
+    DECRYPT_CACHE_SIZE,
     DEVICE_TYPE_COVER,
     DEVICE_TYPE_DIMMER,
     DEVICE_TYPE_LIGHT,
@@ -40,8 +42,172 @@ from .const import (
     SYNC_ENDPOINT,
 )
 
+try:
+    from Crypto.Cipher import AES as CryptodomeAES
+except ImportError:  # PyCryptodome is optional
+    CryptodomeAES = None
+
 _LOGGER = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Valid PKCS7 padding tails, indexed by pad length
+_PKCS7_PADDING = tuple(bytes((n,)) * n for n in range(17))
+
+# Zero IV used by the ICS-2000 for AES-CBC
+_ZERO_IV = b'\x00' * 16
+
+# Hex lengths of valid AES-128/192/256 keys
+_AES_KEY_HEX_LENGTHS = frozenset((32, 48, 64))
+
+
+def _make_aes_decrypt(key: bytes) -> Callable[[bytes], bytes]:
+    """Return an AES-CBC (zero IV) decrypt function for the given key."""
+    if CryptodomeAES is not None:
+        # PyCryptodome calls straight into its AES-NI routine
+        def aes_decrypt(encrypted: bytes) -> bytes:
+            return CryptodomeAES.new(key, CryptodomeAES.MODE_CBC, iv=_ZERO_IV).decrypt(encrypted)
+        
+        return aes_decrypt
+    
+    cipher = Cipher(algorithms.AES(key), modes.CBC(_ZERO_IV))
+    
+    def aes_decrypt(encrypted: bytes) -> bytes:
+        decryptor = cipher.decryptor()
+        return decryptor.update(encrypted) + decryptor.finalize()
+    
+    return aes_decrypt
+
+
+# Name keywords per device type, in priority order
+_TYPE_KEYWORDS = (
+    (("motion", "sensor", "detector", "pir"), DEVICE_TYPE_SENSOR),
+    (("dimmer", "dim", "brightness"), DEVICE_TYPE_DIMMER),
+    (("lamp", "light", "bulb", "led"), DEVICE_TYPE_LIGHT),
+    (("blind", "shutter", "curtain", "cover"), DEVICE_TYPE_COVER),
+    (("plug", "socket", "outlet", "switch"), DEVICE_TYPE_SWITCH),
+)
+_DIMMABLE_PATTERN = re.compile(r"dim|brightness")
+_DIMMABLE_TYPES = frozenset({DEVICE_TYPE_DIMMER, DEVICE_TYPE_COVER})
+
+# Keyword -> (priority, device type)
+_KEYWORD_TO_TYPE = {
+    keyword: (priority, device_type)
+    for priority, (keywords, device_type) in enumerate(_TYPE_KEYWORDS)
+    for keyword in keywords
+}
+
+# Finds every keyword occurrence in a single pass; the lookahead lets
+# matches overlap so no keyword can hide another
+_KEYWORD_PATTERN = re.compile("(?=(%s))" % "|".join(_KEYWORD_TO_TYPE))
+
+# Fallback device type by module device value
+_VALUE_TO_TYPE = {2: DEVICE_TYPE_DIMMER, 4: DEVICE_TYPE_DIMMER}
+
+
+@lru_cache(maxsize=512)
+def _guess_device_type_cached(device_name: str, device_value: int) -> int:
+    """Guess device type from name."""
+    name_lower = device_name.lower()
+    
+    hits = [
+        _KEYWORD_TO_TYPE[match.group(1)]
+        for match in _KEYWORD_PATTERN.finditer(name_lower)
+    ]
+    if hits:
+        return min(hits)[1]
+    
+    # Default based on value
+    return _VALUE_TO_TYPE.get(device_value, DEVICE_TYPE_SWITCH)
+
+
+@lru_cache(maxsize=512)
+def _guess_if_dimmable_cached(device_name: str, device_type: int) -> bool:
+    """Guess if device is dimmable."""
+    if device_type in _DIMMABLE_TYPES:
+        return True
+    
+    return _DIMMABLE_PATTERN.search(device_name.lower()) is not None
+
+
+def _state_from_version_status(version_status: Any) -> bool:
+    """Return the on/off state encoded in a module's version_status (odd means on)."""
+    if isinstance(version_status, int):
+        return (version_status & 1) == 1
+    if isinstance(version_status, str) and version_status.isdigit():
+        return (int(version_status) & 1) == 1
+    return False
+
+
+def _parse_module_ids(module_ids: str | Iterable[int | str] | None) -> FrozenSet[int]:
+    """Parse module IDs from a list or a comma-separated options string."""
+    if isinstance(module_ids, str):
+        # The options flow stores the blacklist as text from a TextSelector
+        module_ids = module_ids.split(",")
+    
+    parsed = set()
+    for module_id in module_ids or ():
+        if isinstance(module_id, str):
+            module_id = module_id.strip()
+            if not module_id.isdigit():
+                if module_id:
+                    _LOGGER.warning("Ignoring invalid blacklist entry: %s", module_id)
+                continue
+        parsed.add(int(module_id))
+    return frozenset(parsed)
+
+
+# Marks DeviceRecord fields that have not been set, like an absent dict key
+_MISSING: Any = object()
+
+
+@dataclass(slots=True)
+class DeviceRecord:
+    """Compact per-device state kept by the hub.
+    
+    Field names match the ATTR_* keys so entities can keep reading
+    records with ``device.get(key)`` / ``device[key]``.
+    """
+    
+    device_id: int
+    device_type: int
+    device_model: str
+    dimmable: bool
+    state: bool = False
+    brightness: Optional[int] = None
+    position: Optional[int] = None
+    device_value: Any = 0
+    version_status: Optional[str] = None
+    version_data: Optional[str] = None
+    zigbee: bool = False
+    # Only present once state tracking has set them
+    last_command: Any = _MISSING
+    last_update: Any = _MISSING
+    confidence: Any = _MISSING
+    
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __contains__(self, key: str) -> bool:
+        # Like a dict key: a field set to None is still present
+        return getattr(self, key, _MISSING) is not _MISSING
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field value, or default when it is not a field or never set."""
+        value = getattr(self, key, _MISSING)
+        return default if value is _MISSING else value
+
 
 class ICS2000Hub:
     """ICS-2000 Hub with proper device name extraction."""
@@ -61,7 +227,9 @@ class ICS2000Hub:
         """Initialize the hub."""
         self.hass = hass
         self.mac = mac.upper().replace(":", "")
-        self.mac_formatted = ":".join([self.mac[i:i+2] for i in range(0, 12, 2)])
+        self.mac_formatted = bytes.fromhex(self.mac).hex(":").upper()
+        # Shared by the DeviceInfo of every child entity
+        self.via_device = (DOMAIN, self.mac)
         self.email = email
         self.password = password
         self.ip_address = ip_address
@@ -70,13 +238,23 @@ class ICS2000Hub:
         self.state_manager = state_manager
         
         # Authentication
-        self._session = None
+        self._session: Optional[aiohttp.ClientSession] = None
         self._home_id = None
         self._gateway_mac = None
         self._aes_key = aes_key
         
+        # Pre-encoded form bodies (the sync body depends on auth results)
+        self._auth_body = urlencode({
+            'email': self.email,
+            'mac': self.mac,
+            'password_hash': self.password,
+            'action': 'check',
+        }).encode()
+        self._sync_body: Optional[bytes] = None
+        
         # Devices
-        self.devices: Dict[int, Dict[str, Any]] = {}
+        self.devices: Dict[int, DeviceRecord] = {}
+        self._devices_view: Optional[Tuple[DeviceRecord, ...]] = None
         self.scenes: Dict[int, Dict[str, Any]] = {}
         self.firmware_version = "1.0.0"
         self._connected = False
@@ -86,70 +264,89 @@ class ICS2000Hub:
         self._raw_modules: Dict[int, Dict[str, Any]] = {}
         
         # Device blacklist
-        self.entity_blacklist: List[int] = []
+        self._entity_blacklist: FrozenSet[int] = frozenset()
+        
+        # Decrypted payloads keyed by ciphertext (LRU, guarded for executor jobs)
+        self._decrypt_cache: OrderedDict[str, Optional[Dict]] = OrderedDict()
+        self._decrypt_cache_lock = threading.Lock()
+        
+        # AES decrypt function paired with the key it was built from
+        self._aes_decrypt: Optional[Tuple[str, Callable[[bytes], bytes]]] = None
         
         # Command sequence
-        self._sequence = random.randint(1000, 9999)
+        self._sequence = time.monotonic_ns() & 0x1FFF | 0x1000
     
     def _decrypt_kaku_data(self, encrypted_b64: str) -> Optional[Dict]:
-        """Decrypt KlikAanKlikUit data."""
+        """Decrypt KlikAanKlikUit data, reusing earlier results."""
         if not self._aes_key or not encrypted_b64:
             return None
         
+        with self._decrypt_cache_lock:
+            if encrypted_b64 in self._decrypt_cache:
+                self._decrypt_cache.move_to_end(encrypted_b64)
+                return self._decrypt_cache[encrypted_b64]
+        
+        decrypted = self._decrypt_kaku_data_uncached(encrypted_b64)
+        
+        with self._decrypt_cache_lock:
+            self._decrypt_cache[encrypted_b64] = decrypted
+            if len(self._decrypt_cache) > DECRYPT_CACHE_SIZE:
+                self._decrypt_cache.popitem(last=False)
+        
+        return decrypted
+    
+    def _get_aes_decrypt(self) -> Callable[[bytes], bytes]:
+        """Return the AES-CBC decrypt function for the current key, building it once."""
+        cached = self._aes_decrypt
+        if cached is not None and cached[0] == self._aes_key:
+            return cached[1]
+        
+        aes_decrypt = _make_aes_decrypt(bytes.fromhex(self._aes_key))
+        self._aes_decrypt = (self._aes_key, aes_decrypt)
+        return aes_decrypt
+    
+    def _decrypt_kaku_data_uncached(self, encrypted_b64: str) -> Optional[Dict]:
+        """Decrypt KlikAanKlikUit data."""
         try:
-            aes_key = bytes.fromhex(self._aes_key)
             encrypted = base64.b64decode(encrypted_b64)
             
-            # Use CBC mode with zero IV
-            iv = b'\x00' * 16
-            cipher = Cipher(algorithms.AES(aes_key), modes.CBC(iv), backend=default_backend())
-            decryptor = cipher.decryptor()
-            decrypted = decryptor.update(encrypted) + decryptor.finalize()
+            decrypted = self._get_aes_decrypt()(encrypted)
+            
+            # Remove PKCS7 padding if present
+            if decrypted:
+                pad_len = decrypted[-1]
+                if 0 < pad_len <= 16 and decrypted.endswith(_PKCS7_PADDING[pad_len]):
+                    decrypted = decrypted[:-pad_len]
             
             # Find JSON start
-            json_start = -1
-            for i in range(len(decrypted)):
-                if decrypted[i:i+1] in [b'{', b'[']:
-                    json_start = i
-                    break
+            json_start = decrypted.find(b'{')
+            array_start = decrypted.find(b'[')
+            if 0 <= array_start and (json_start < 0 or array_start < json_start):
+                json_start = array_start
             
-            if json_start == -1:
+            if json_start < 0:
                 return None
             
             json_bytes = decrypted[json_start:]
             
-            # Remove PKCS7 padding if present
-            if len(json_bytes) > 0:
-                pad_len = json_bytes[-1]
-                if isinstance(pad_len, int) and 0 < pad_len <= 16:
-                    if all(b == pad_len for b in json_bytes[-pad_len:]):
-                        json_bytes = json_bytes[:-pad_len]
-            
-            json_str = json_bytes.decode('utf-8', errors='ignore')
-            
-            # Find end of JSON
-            depth = 0
-            end_pos = 0
-            for i, char in enumerate(json_str):
-                if char in '{[':
-                    depth += 1
-                elif char in '}]':
-                    depth -= 1
-                    if depth == 0:
-                        end_pos = i + 1
-                        break
-            
-            if end_pos > 0:
-                json_str = json_str[:end_pos]
-                return json.loads(json_str)
+            try:
+                return json_loads(json_bytes)
+            except ValueError:
+                # Parse up to the end of the JSON value, ignoring trailing bytes
+                json_str = json_bytes.decode('utf-8', errors='ignore')
+                decoded, _ = _JSON_DECODER.raw_decode(json_str)
+                return decoded
             
         except Exception as e:
-            _LOGGER.debug(f"Decryption error: {e}")
+            _LOGGER.debug("Decryption error: %s", e)
         
         return None
     
     def _extract_device_name(self, module_data: Dict) -> Optional[str]:
         """Extract device name from module data."""
+        if not module_data.get('data') and not module_data.get('status'):
+            return None
+        
         try:
             # Try to decrypt the 'data' field
             if 'data' in module_data and module_data['data']:
@@ -186,79 +383,95 @@ class ICS2000Hub:
                         return module['device']
             
         except Exception as e:
-            _LOGGER.debug(f"Error extracting device name: {e}")
+            _LOGGER.debug("Error extracting device name: %s", e)
         
         return None
     
+    def _extract_device_names(
+        self, modules: List[Tuple[int, Dict]]
+    ) -> Dict[int, Optional[str]]:
+        """Extract device names for a batch of modules (runs in executor)."""
+        # Already on an HA executor thread; decrypting inline avoids starting
+        # a nested pool per poll for work that mostly holds the GIL
+        return {
+            module_id: self._extract_device_name(module_data)
+            for module_id, module_data in modules
+        }
+    
+    @staticmethod
+    def _module_unchanged(device: DeviceRecord, module_data: Dict) -> bool:
+        """Return True if the module's versions match the known device."""
+        version_data = module_data.get('version_data')
+        return (
+            version_data is not None
+            and device.version_data == version_data
+            and device.version_status == module_data.get('version_status', '0')
+        )
+    
     def _guess_device_type(self, device_name: str, device_value: int = 0) -> int:
         """Guess device type from name."""
-        name_lower = device_name.lower()
-        
-        if any(x in name_lower for x in ["motion", "sensor", "detector", "pir"]):
-            return DEVICE_TYPE_SENSOR
-        elif any(x in name_lower for x in ["dimmer", "dim", "brightness"]):
-            return DEVICE_TYPE_DIMMER
-        elif any(x in name_lower for x in ["lamp", "light", "bulb", "led"]):
-            return DEVICE_TYPE_LIGHT
-        elif any(x in name_lower for x in ["blind", "shutter", "curtain", "cover"]):
-            return DEVICE_TYPE_COVER
-        elif any(x in name_lower for x in ["plug", "socket", "outlet", "switch"]):
-            return DEVICE_TYPE_SWITCH
-        
-        # Default based on value
-        if device_value in [2, 4]:
-            return DEVICE_TYPE_DIMMER
-        
-        return DEVICE_TYPE_SWITCH
+        return _guess_device_type_cached(device_name, device_value)
     
     def _guess_if_dimmable(self, device_name: str, device_type: int) -> bool:
         """Guess if device is dimmable."""
-        if device_type in [DEVICE_TYPE_DIMMER, DEVICE_TYPE_COVER]:
-            return True
-        
-        name_lower = device_name.lower()
-        return any(x in name_lower for x in ["dimmer", "dim", "brightness", "dimmable"])
+        return _guess_if_dimmable_cached(device_name, device_type)
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the cloud session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            # Keep connections alive across polls and cache DNS lookups
+            connector = aiohttp.TCPConnector(
+                limit=4,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                ssl=False,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Connection": "keep-alive"},
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self._session
     
     async def async_authenticate(self) -> bool:
         """Authenticate with the cloud service."""
-        if not self._session:
-            self._session = aiohttp.ClientSession()
-        
-        auth_data = {
-            'email': self.email,
-            'mac': self.mac,
-            'password_hash': self.password,
-            'action': 'check',
-        }
-        
         try:
-            async with self._session.post(
+            async with self._get_session().post(
                 AUTH_ENDPOINT,
-                data=auth_data,
-                timeout=aiohttp.ClientTimeout(total=10),
-                ssl=False,
+                data=self._auth_body,
+                headers=_FORM_HEADERS,
             ) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = json_loads(await response.read())
                     
                     if result.get('status') == 'ok':
+                        aes_key = result.get('aes_key', '')
+                        if aes_key and len(aes_key) not in _AES_KEY_HEX_LENGTHS:
+                            _LOGGER.error("Invalid AES key length: %s", len(aes_key))
+                            return False
+                        
                         self._home_id = result.get('home_id', '')
                         self._gateway_mac = result.get('mac', self.mac)
-                        self._aes_key = result.get('aes_key', '')
+                        self._aes_key = aes_key
+                        self._sync_body = None
                         
-                        _LOGGER.info(f"✓ Authenticated successfully!")
+                        # The key may have rotated
+                        with self._decrypt_cache_lock:
+                            self._decrypt_cache.clear()
+                        
+                        _LOGGER.info("✓ Authenticated successfully!")
                         self._connected = True
                         return True
                     else:
-                        _LOGGER.error(f"Authentication failed: {result}")
+                        _LOGGER.error("Authentication failed: %s", result)
         
         except Exception as e:
-            _LOGGER.error(f"Authentication error: {e}")
+            _LOGGER.error("Authentication error: %s", e)
         
         self._connected = False
         return False
     
-    async def async_discover_devices(self) -> Dict[int, Dict[str, Any]]:
+    async def async_discover_devices(self) -> Dict[int, DeviceRecord]:
         """Discover devices with proper name extraction."""
         if not self._aes_key:
             _LOGGER.error("No AES key available")
@@ -266,47 +479,89 @@ class ICS2000Hub:
         
         _LOGGER.info("Discovering devices...")
         
-        sync_data = {
-            'email': self.email,
-            'mac': self._gateway_mac or self.mac,
-            'action': 'sync',
-            'password_hash': self.password,
-            'home_id': self._home_id or '',
-        }
+        if self._sync_body is None:
+            self._sync_body = urlencode({
+                'email': self.email,
+                'mac': self._gateway_mac or self.mac,
+                'action': 'sync',
+                'password_hash': self.password,
+                'home_id': self._home_id or '',
+            }).encode()
         
         try:
-            async with self._session.post(
+            async with self._get_session().post(
                 SYNC_ENDPOINT,
-                data=sync_data,
-                timeout=aiohttp.ClientTimeout(total=10),
-                ssl=False,
+                data=self._sync_body,
+                headers=_FORM_HEADERS,
             ) as response:
                 if response.status == 200:
-                    text = await response.text()
-                    sync_response = json.loads(text)
+                    sync_response = json_loads(await response.read())
                     
                     if isinstance(sync_response, list):
-                        _LOGGER.info(f"Found {len(sync_response)} modules")
+                        _LOGGER.info("Found %s modules", len(sync_response))
                         
                         device_count = 0
                         
+                        devices = self.devices
+                        entity_blacklist = self.entity_blacklist
+                        
+                        modules = []
+                        device_names: Dict[int, Optional[str]] = {}
+                        unchanged_ids = set()
+                        changed_modules = []
                         for module_data in sync_response:
                             module_id = int(module_data.get('id', 0))
                             
-                            if module_id <= 0 or module_id in self.entity_blacklist:
+                            if module_id <= 0 or module_id in entity_blacklist:
                                 continue
                             
+                            modules.append((module_id, module_data))
+                            
+                            # Modules whose versions did not change keep their known record
+                            known = devices.get(module_id)
+                            if known is not None and self._module_unchanged(known, module_data):
+                                unchanged_ids.add(module_id)
+                            # Modules without encrypted fields have no name to decrypt
+                            elif module_data.get('data') or module_data.get('status'):
+                                changed_modules.append((module_id, module_data))
+                        
+                        # Keep records of modules missing from one (possibly partial)
+                        # response; only devices blacklisted since the last poll go
+                        blacklisted_ids = devices.keys() & entity_blacklist
+                        for module_id in blacklisted_ids:
+                            self._remove_device(module_id)
+                        records_changed = bool(blacklisted_ids)
+                        
+                        # Decrypt the remaining device names off the event loop
+                        if changed_modules:
+                            device_names.update(
+                                await self.hass.async_add_executor_job(
+                                    self._extract_device_names, changed_modules
+                                )
+                            )
+                        
+                        for module_id, module_data in modules:
                             # Store raw module data
                             self._raw_modules[module_id] = module_data
+                            device_count += 1
+                            
+                            # Get state (odd version_status means on)
+                            version_status = module_data.get('version_status', '0')
+                            current_state = _state_from_version_status(version_status)
+                            
+                            if module_id in unchanged_ids:
+                                # Keep the record, but undo any optimistic state change
+                                devices[module_id].state = current_state
+                                continue
                             
                             # Extract the actual device name
-                            device_name = self._extract_device_name(module_data)
+                            device_name = device_names.get(module_id)
                             
                             if not device_name:
                                 device_name = f"Device {module_id}"
-                                _LOGGER.debug(f"No name found for module {module_id}")
+                                _LOGGER.debug("No name found for module %s", module_id)
                             else:
-                                _LOGGER.info(f"Found device: '{device_name}' (ID: {module_id})")
+                                _LOGGER.debug("Found device: '%s' (ID: %s)", device_name, module_id)
                             
                             # Determine device type
                             device_value = module_data.get('device', 0)
@@ -316,33 +571,27 @@ class ICS2000Hub:
                             device_type = self._guess_device_type(device_name, device_value)
                             is_dimmable = self._guess_if_dimmable(device_name, device_type)
                             
-                            # Get state
-                            current_state = False
-                            version_status = module_data.get('version_status', '0')
-                            if version_status and version_status != '0':
-                                try:
-                                    current_state = (int(version_status) % 2) == 1
-                                except:
-                                    pass
-                            
                             # Create device
-                            self.devices[module_id] = {
-                                ATTR_DEVICE_ID: module_id,
-                                ATTR_DEVICE_TYPE: device_type,
-                                ATTR_DEVICE_MODEL: device_name,
-                                ATTR_DIMMABLE: is_dimmable,
-                                ATTR_ZIGBEE: False,
-                                "state": current_state,
-                                "brightness": 50 if is_dimmable else None,
-                                "position": None,
-                                "device_value": device_value,
-                                "version_status": version_status,
-                                "version_data": module_data.get('version_data'),
-                            }
-                            
-                            device_count += 1
+                            devices[module_id] = DeviceRecord(
+                                device_id=module_id,
+                                device_type=device_type,
+                                device_model=device_name,
+                                dimmable=is_dimmable,
+                                state=current_state,
+                                brightness=50 if is_dimmable else None,
+                                device_value=device_value,
+                                version_status=version_status,
+                                version_data=module_data.get('version_data'),
+                            )
+                            records_changed = True
+                        
+                        if records_changed:
+                            # Records were added, replaced or removed; rebuild the view on next read
+                            self._devices_view = None
+                        else:
+                            _LOGGER.debug("No module versions changed")
                         
-                        _LOGGER.info(f"✓ Created {device_count} devices")
+                        _LOGGER.info("✓ Created %s devices", device_count)
                         
                         # Fire discovery event
                         self.hass.bus.async_fire(
@@ -353,26 +602,26 @@ class ICS2000Hub:
                             },
                         )
                     else:
-                        _LOGGER.error(f"Unexpected response format")
+                        _LOGGER.error("Unexpected response format")
                         
         except Exception as e:
-            _LOGGER.error(f"Device discovery error: {e}")
+            _LOGGER.error("Device discovery error: %s", e)
         
         return self.devices
     
     async def async_turn_on(self, device_id: int) -> None:
         """Turn on a device."""
-        _LOGGER.info(f"Turning on device {device_id}")
+        _LOGGER.info("Turning on device %s", device_id)
         # Implementation would go here
         if device_id in self.devices:
-            self.devices[device_id]["state"] = True
+            self.devices[device_id].state = True
     
     async def async_turn_off(self, device_id: int) -> None:
         """Turn off a device."""
-        _LOGGER.info(f"Turning off device {device_id}")
+        _LOGGER.info("Turning off device %s", device_id)
         # Implementation would go here
         if device_id in self.devices:
-            self.devices[device_id]["state"] = False
+            self.devices[device_id].state = False
     
     async def async_close(self) -> None:
         """Close the hub connection."""
@@ -381,13 +630,42 @@ class ICS2000Hub:
             self._session = None
         self._connected = False
     
-    def get_device(self, device_id: int) -> Optional[Dict[str, Any]]:
+    async def async_disconnect(self) -> None:
+        """Disconnect from the hub and release the cloud session."""
+        await self.async_close()
+    
+    def _remove_device(self, device_id: int) -> None:
+        """Forget a device and remove it, with its entities, from the device registry."""
+        del self.devices[device_id]
+        self._raw_modules.pop(device_id, None)
+        
+        device_registry = dr.async_get(self.hass)
+        device_entry = device_registry.async_get_device(
+            identifiers={(DOMAIN, f"{self.mac}_{device_id}")}
+        )
+        if device_entry is not None:
+            device_registry.async_remove_device(device_entry.id)
+            _LOGGER.info("Removed blacklisted device %s", device_id)
+    
+    def get_device(self, device_id: int) -> Optional[DeviceRecord]:
         """Get device by ID."""
         return self.devices.get(device_id)
     
-    def get_all_devices(self) -> List[Dict[str, Any]]:
+    def get_all_devices(self) -> Tuple[DeviceRecord, ...]:
         """Get all devices."""
-        return list(self.devices.values())
+        if self._devices_view is None:
+            self._devices_view = tuple(self.devices.values())
+        return self._devices_view
+    
+    @property
+    def entity_blacklist(self) -> FrozenSet[int]:
+        """Return the blacklisted module IDs."""
+        return self._entity_blacklist
+    
+    @entity_blacklist.setter
+    def entity_blacklist(self, module_ids: str | Iterable[int | str] | None) -> None:
+        """Set the blacklisted module IDs."""
+        self._entity_blacklist = _parse_module_ids(module_ids)
     
     @property
     def connected(self) -> bool:
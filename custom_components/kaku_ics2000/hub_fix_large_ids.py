@@ -1,13 +1,21 @@
 """Hub fix for large device IDs - handles module IDs > 255 properly."""
 
+# In __init__, precompute the constant packet prefix (magic + MAC) once:
+#
+#     self._packet_prefix = b'\xAA\xAA' + bytes.fromhex(self.mac)
+#     self._packet_prefix_sum = sum(self._packet_prefix)
+#
+# and bound concurrent cloud control requests:
+#
+#     self._control_semaphore = asyncio.Semaphore(4)
+
+# Command byte per command name (unknown commands are sent as 'on')
+_COMMAND_CODES = {'on': 0x01, 'off': 0x00, 'dim': 0x02}
+
 # In the _build_command_packet method, replace with:
 
 def _build_command_packet(self, device_id: int, command: str, value: int = 0) -> bytes:
     """Build command packet - FIXED for large device IDs."""
-    packet = bytearray()
-    packet.extend(b'\xAA\xAA')
-    packet.extend(bytes.fromhex(self.mac))
-    
     # CRITICAL FIX: For large module IDs, we need different handling
     if device_id > 255:
         # Try using the lower 8 bits mapped differently
@@ -23,25 +31,16 @@ def _build_command_packet(self, device_id: int, command: str, value: int = 0) ->
         # mapped_id = (device_id >> 8) & 0xFF
         
         _LOGGER.warning(f"Large device ID {device_id} mapped to {mapped_id} for 433MHz transmission")
-        packet.append(mapped_id)
-    else:
-        packet.append(device_id)
-    
-    if command == 'on':
-        packet.append(0x01)
-    elif command == 'off':
-        packet.append(0x00)
-    elif command == 'dim':
-        packet.append(0x02)
     else:
-        packet.append(0x01)
+        mapped_id = device_id
     
-    packet.append(value & 0xFF)
+    code = _COMMAND_CODES.get(command, 0x01)
+    value &= 0xFF
     
-    checksum = sum(packet) & 0xFF
-    packet.append(checksum)
+    # The prefix is constant, so only the variable bytes are added to its sum
+    checksum = (self._packet_prefix_sum + mapped_id + code + value) & 0xFF
     
-    return bytes(packet)
+    return self._packet_prefix + bytes((mapped_id, code, value, checksum))
 
 # Alternative: Try cloud-only control for large IDs
 async def _send_cloud_command(self, device_id: int, command: str) -> bool:
@@ -61,11 +60,10 @@ async def _send_cloud_command(self, device_id: int, command: str) -> bool:
     }
     
     try:
-        async with self._session.post(
+        # The shared session already carries the timeout and SSL settings
+        async with self._get_session().post(
             "https://trustsmartcloud2.com/ics2000_api/control.php",  # Might exist
             data=control_data,
-            timeout=aiohttp.ClientTimeout(total=10),
-            ssl=False,
         ) as response:
             if response.status == 200:
                 return True
@@ -74,6 +72,17 @@ async def _send_cloud_command(self, device_id: int, command: str) -> bool:
     
     return False
 
+async def _send_cloud_commands(self, commands: list) -> list:
+    """Send several (device_id, command) pairs via cloud concurrently."""
+    
+    async def send_one(device_id: int, command: str) -> bool:
+        async with self._control_semaphore:
+            return await self._send_cloud_command(device_id, command)
+    
+    return await asyncio.gather(
+        *(send_one(device_id, command) for device_id, command in commands)
+    )
+
 # Modified command methods
 async def async_turn_on(self, device_id: int) -> bool:
     """Turn on - try local first, then cloud for large IDs."""
@@ -102,7 +102,6 @@ def main():
                                     
                                     # Decrypt each module
                                     from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-                                    from cryptography.hazmat.backends import default_backend
                                     
                                     aes_key = bytes.fromhex(aes_key_hex)
                                     
@@ -116,31 +115,19 @@ def main():
                                                 encrypted = base64.b64decode(encrypted_data)
                                                 
                                                 iv = b'\x00' * 16
-                                                cipher = Cipher(algorithms.AES(aes_key), modes.CBC(iv), backend=default_backend())
+                                                cipher = Cipher(algorithms.AES(aes_key), modes.CBC(iv))
                                                 decryptor = cipher.decryptor()
                                                 decrypted = decryptor.update(encrypted) + decryptor.finalize()
                                                 
-                                                # Find JSON
-                                                for i in range(len(decrypted)):
-                                                    if decrypted[i:i+1] == b'{':
-                                                        json_text = decrypted[i:].decode('utf-8', errors='ignore')
-                                                        # Find end
-                                                        depth = 0
-                                                        for j, char in enumerate(json_text):
-                                                            if char == '{':
-                                                                depth += 1
-                                                            elif char == '}':
-                                                                depth -= 1
-                                                                if depth == 0:
-                                                                    json_text = json_text[:j+1]
-                                                                    break
-                                                        
-                                                        data = json.loads(json_text)
-                                                        if 'module' in data:
-                                                            module = data['module']
-                                                            print(f"      Name: {module.get('name', 'Unknown')}")
-                                                            print(f"      Type/Device: {module.get('device', 'Unknown')}")
-                                                        break
+                                                # Find JSON and parse up to the end of the object
+                                                json_start = decrypted.find(b'{')
+                                                if json_start >= 0:
+                                                    json_text = decrypted[json_start:].decode('utf-8', errors='ignore')
+                                                    data, _ = json.JSONDecoder().raw_decode(json_text)
+                                                    if 'module' in data:
+                                                        module = data['module']
+                                                        print(f"      Name: {module.get('name', 'Unknown')}")
+                                                        print(f"      Type/Device: {module.get('device', 'Unknown')}")
                                             except:
                                                 print(f"      (Couldn't decrypt)")
                                     
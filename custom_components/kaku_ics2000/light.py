@@ -12,7 +12,7 @@ from homeassistant.components.light import (
     LightEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -32,11 +32,34 @@ from .const import (
     DEVICE_TYPE_DIMMER,
     DEVICE_TYPE_LIGHT,
     DOMAIN,
+    MANUFACTURER,
 )
 from .hub import ICS2000Hub
 
 _LOGGER = logging.getLogger(__name__)
 
+# Brightness lookups: hub percentage (0-100) <-> HA brightness (0-255)
+_HA_FROM_PCT = tuple(int((pct / 100) * 255) for pct in range(101))
+_PCT_FROM_HA = tuple(int((value / 255) * 100) for value in range(256))
+
+# Immutable class attributes shared by every light entity
+_ONOFF_COLOR_MODES = frozenset({ColorMode.ONOFF})
+_BRIGHTNESS_COLOR_MODES = frozenset({ColorMode.BRIGHTNESS})
+_EFFECT_LIST = ("identify",)
+
+# Device fields shown in the extra state attributes
+_ATTRIBUTE_KEYS = (
+    ATTR_DEVICE_TYPE,
+    ATTR_DEVICE_MODEL,
+    ATTR_ZIGBEE,
+    ATTR_DIMMABLE,
+    ATTR_LAST_COMMAND,
+    ATTR_LAST_UPDATE,
+    ATTR_CONFIDENCE,
+    "version_status",
+    "version_data",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -89,6 +112,14 @@ class KakuLight(CoordinatorEntity, LightEntity):
     
     _attr_has_entity_name = True
     
+    # Basic on/off mode
+    _attr_supported_color_modes = _ONOFF_COLOR_MODES
+    _attr_color_mode = ColorMode.ONOFF
+    
+    # Features
+    _attr_supported_features = LightEntityFeature.EFFECT
+    _attr_effect_list = _EFFECT_LIST
+    
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -103,7 +134,7 @@ class KakuLight(CoordinatorEntity, LightEntity):
         self._device_id = device_id
         self._config_entry_id = config_entry_id
         
-        # Get device info from hub
+        # Get device info from hub (refreshed on every coordinator update)
         self._device = hub.get_device(device_id) or {}
         
         # Set unique ID
@@ -117,32 +148,52 @@ class KakuLight(CoordinatorEntity, LightEntity):
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{hub.mac}_{device_id}")},
             name=device_name,
-            manufacturer="KlikAanKlikUit",
+            manufacturer=MANUFACTURER,
             model=self._device.get(ATTR_DEVICE_MODEL, "Light"),
-            via_device=(DOMAIN, hub.mac),
+            via_device=hub.via_device,
         )
         
         # We have real state tracking now!
         self._attr_assumed_state = False
         
-        # Set supported features
-        self._setup_features()
+        # Last values written to HA, to skip unchanged coordinator updates
+        self._last_rendered: Optional[tuple] = None
+        self._attributes_cache: Optional[dict[str, Any]] = None
     
-    def _setup_features(self) -> None:
-        """Set up supported features."""
-        # Basic on/off mode
-        self._attr_supported_color_modes = {ColorMode.ONOFF}
-        self._attr_color_mode = ColorMode.ONOFF
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the hub device and write state only when it changed."""
+        device = self._device = self._hub.get_device(self._device_id) or {}
+        # Everything is_on, brightness and _build_attributes read, so a
+        # replaced or updated device record always invalidates the caches
+        rendered = (
+            self._hub.connected,
+            device.get("state", False),
+            device.get("brightness"),
+            *(device.get(key) for key in _ATTRIBUTE_KEYS),
+        )
+        if rendered == self._last_rendered:
+            return
         
-        # Features
-        self._attr_supported_features = LightEntityFeature.EFFECT
-        self._attr_effect_list = ["identify"]
+        self._last_rendered = rendered
+        self._attributes_cache = None
+        super()._handle_coordinator_update()
+    
+    @callback
+    def _async_write_optimistic_state(self) -> None:
+        """Write a state change made by a command before the next poll confirms it.
+        
+        Forget the last rendered values so the next coordinator update is
+        written even if it reverts the device to its pre-command state.
+        """
+        self._last_rendered = None
+        self._attributes_cache = None
+        self.async_write_ha_state()
     
     @property
     def is_on(self) -> bool:
         """Return true if light is on."""
-        device = self._hub.get_device(self._device_id)
-        return device.get("state", False) if device else False
+        return self._device.get("state", False)
     
     @property
     def available(self) -> bool:
@@ -152,7 +203,13 @@ class KakuLight(CoordinatorEntity, LightEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        device = self._hub.get_device(self._device_id)
+        if self._attributes_cache is None:
+            self._attributes_cache = self._build_attributes()
+        return self._attributes_cache
+    
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the extra state attributes from the cached device."""
+        device = self._device
         if not device:
             return {}
         
@@ -185,15 +242,17 @@ class KakuLight(CoordinatorEntity, LightEntity):
         """Turn on the light."""
         await self._hub.async_turn_on(self._device_id)
         
-        # Request coordinator refresh
-        await self.coordinator.async_request_refresh()
+        # Update optimistically; the next poll confirms the state
+        self._device["state"] = True
+        self._async_write_optimistic_state()
     
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
         await self._hub.async_turn_off(self._device_id)
         
-        # Request coordinator refresh
-        await self.coordinator.async_request_refresh()
+        # Update optimistically; the next poll confirms the state
+        self._device["state"] = False
+        self._async_write_optimistic_state()
     
     async def async_set_effect(self, effect: str) -> None:
         """Set effect."""
@@ -204,25 +263,24 @@ class KakuLight(CoordinatorEntity, LightEntity):
 class KakuDimmableLight(KakuLight):
     """KlikAanKlikUit Dimmable Light."""
     
-    def _setup_features(self) -> None:
-        """Set up supported features for dimmable light."""
-        # Brightness mode
-        self._attr_supported_color_modes = {ColorMode.BRIGHTNESS}
-        self._attr_color_mode = ColorMode.BRIGHTNESS
-        
-        # Features
-        self._attr_supported_features = LightEntityFeature.EFFECT
-        self._attr_effect_list = ["identify"]
+    # Brightness mode
+    _attr_supported_color_modes = _BRIGHTNESS_COLOR_MODES
+    _attr_color_mode = ColorMode.BRIGHTNESS
     
     @property
     def brightness(self) -> Optional[int]:
         """Return brightness (0-255 for HA)."""
-        device = self._hub.get_device(self._device_id)
-        if device and device.get("brightness") is not None:
-            brightness = device["brightness"]
+        device = self._device
+        if device.get("brightness") is not None:
+            # The cloud payload may carry floats or strings
+            try:
+                brightness = int(float(device["brightness"]))
+            except (TypeError, ValueError):
+                return 255 if self.is_on else 0
+            
             # Convert 0-100 to 0-255 for HA
             if brightness <= 100:
-                return int((brightness / 100) * 255)
+                return _HA_FROM_PCT[max(brightness, 0)]
             else:
                 return brightness
         
@@ -232,10 +290,12 @@ class KakuDimmableLight(KakuLight):
         """Turn on the light with optional brightness."""
         if ATTR_BRIGHTNESS in kwargs:
             # Convert 0-255 to 0-100 for the hub
-            brightness = int((kwargs[ATTR_BRIGHTNESS] / 255) * 100)
+            brightness = _PCT_FROM_HA[kwargs[ATTR_BRIGHTNESS]]
             await self._hub.async_set_brightness(self._device_id, brightness)
+            self._device["brightness"] = brightness
         else:
             await self._hub.async_turn_on(self._device_id)
         
-        # Request coordinator refresh
-        await self.coordinator.async_request_refresh()
\ No newline at end of file
+        # Update optimistically; the next poll confirms the state
+        self._device["state"] = True
+        self._async_write_optimistic_state()
\ No newline at end of file
@@ -6,18 +6,31 @@ Handles different padding methods and encryption modes
 
 import json
 import base64
+import functools
 import hashlib
 
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import padding
+    _HAS_CRYPTOGRAPHY = True
+except ImportError:
+    _HAS_CRYPTOGRAPHY = False
+
+try:
+    from Crypto.Cipher import AES
+    from Crypto.Util.Padding import unpad
+    _HAS_PYCRYPTO = True
+except ImportError:
+    _HAS_PYCRYPTO = False
+
+@functools.lru_cache(maxsize=32)
 def try_decrypt_methods(encrypted_data: bytes, key: bytes):
     """Try different decryption methods."""
     results = []
     
     # Try cryptography library if available
-    try:
-        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-        from cryptography.hazmat.backends import default_backend
-        from cryptography.hazmat.primitives import padding
-        
+    if _HAS_CRYPTOGRAPHY:
         # Method 1: AES ECB with PKCS7 padding
         try:
             cipher = Cipher(algorithms.AES(key), modes.ECB(), backend=default_backend())
@@ -63,15 +76,11 @@ def try_decrypt_methods(encrypted_data: bytes, key: bytes):
                 results.append(("AES CBC raw", decrypted))
         except:
             pass
-            
-    except ImportError:
+    else:
         print("cryptography library not available, trying pycrypto/pycryptodome")
     
     # Try with pycrypto/pycryptodome if available
-    try:
-        from Crypto.Cipher import AES
-        from Crypto.Util.Padding import unpad
-        
+    if _HAS_PYCRYPTO:
         # ECB mode
         try:
             cipher = AES.new(key, AES.MODE_ECB)
@@ -98,10 +107,9 @@ def try_decrypt_methods(encrypted_data: bytes, key: bytes):
                 results.append(("PyCrypto CBC raw", decrypted))
         except:
             pass
-    except ImportError:
-        pass
     
-    return results
+    # Tuple so cached results cannot be mutated by callers
+    return tuple(results)
 
 def load_encrypted_data():
     """Load encrypted data from file or use hardcoded values."""
@@ -229,10 +237,12 @@ def main():
             print(f"  Binary (hex): {decrypted[:32].hex()}")
     
     print("\n=== Testing XOR Encryption ===")
-    # Some systems use simple XOR
+    # Some systems use simple XOR; XOR the whole block as one integer
+    block = encrypted_status[:16]
+    block_int = int.from_bytes(block, 'big')
     for i in range(256):
-        xor_key = bytes([i]) * 16
-        decrypted = bytes(a ^ b for a, b in zip(encrypted_status[:16], xor_key))
+        xor_key = int.from_bytes(bytes((i,)) * len(block), 'big')
+        decrypted = (block_int ^ xor_key).to_bytes(len(block), 'big')
         if b'{' in decrypted or b'entity' in decrypted.lower():
             print(f"Possible XOR key: {i:02x}")
             print(f"Result: {decrypted}")
@@ -11,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import DOMAIN, MANUFACTURER
 from .hub import ICS2000Hub
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,8 +33,7 @@ async def async_setup_entry(
         entities.append(
             KakuScene(
                 hub,
-                scene["entityId"],
-                scene["name"],
+                scene,
                 config_entry.entry_id,
             )
         )
@@ -49,17 +48,19 @@ class KakuScene(Scene):
     """KlikAanKlikUit Scene."""
     
     _attr_has_entity_name = True
+    _attr_should_poll = False
     
     def __init__(
         self,
         hub: ICS2000Hub,
-        scene_id: int,
-        name: str,
+        scene: dict[str, Any],
         config_entry_id: str,
     ) -> None:
         """Initialize the scene."""
         self._hub = hub
-        self._scene_id = scene_id
+        self._scene = scene
+        self._scene_id = scene_id = scene["entityId"]
+        name = scene["name"]
         self._config_entry_id = config_entry_id
         
         # Set unique ID
@@ -72,9 +73,9 @@ class KakuScene(Scene):
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{hub.mac}_scene_{scene_id}")},
             name=name,
-            manufacturer="KlikAanKlikUit",
+            manufacturer=MANUFACTURER,
             model="Scene",
-            via_device=(DOMAIN, hub.mac),
+            via_device=hub.via_device,
         )
     
     @property
@@ -85,10 +86,9 @@ class KakuScene(Scene):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        scene = self._hub.scenes.get(self._scene_id, {})
         return {
             "scene_id": self._scene_id,
-            "devices": scene.get("devices", []),
+            "devices": self._scene.get("devices", []),
         }
     
     async def async_activate(self, **kwargs: Any) -> None:
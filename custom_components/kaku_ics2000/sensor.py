@@ -12,7 +12,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -45,17 +45,83 @@ async def async_setup_entry(
     hub: ICS2000Hub = data["hub"]
     coordinator: DataUpdateCoordinator = data["coordinator"]
     
+    # One device pass per coordinator update, shared by the hub sensors
+    summary = _HubSummary(hub, coordinator)
+    
+    # All hub sensors belong to the same hub device
+    device_info = DeviceInfo(identifiers={(DOMAIN, hub.mac)})
+    
     # Create hub-level diagnostic sensors
     entities = [
-        HubConfidenceSensor(coordinator, hub, config_entry.entry_id),
-        HubDeviceCountSensor(coordinator, hub, config_entry.entry_id),
-        HubConnectionSensor(coordinator, hub, config_entry.entry_id),
+        HubConfidenceSensor(coordinator, hub, config_entry.entry_id, device_info, summary),
+        HubDeviceCountSensor(coordinator, hub, config_entry.entry_id, device_info, summary),
+        HubConnectionSensor(coordinator, hub, config_entry.entry_id, device_info),
     ]
     
     async_add_entities(entities)
     _LOGGER.info(f"Added {len(entities)} sensor entities")
 
 
+class _HubSummary:
+    """Device statistics for the hub sensors, computed once per update."""
+    
+    def __init__(self, hub: ICS2000Hub, coordinator: DataUpdateCoordinator) -> None:
+        """Initialize the summary."""
+        self._hub = hub
+        self._coordinator = coordinator
+        # Coordinator data the summary was computed from
+        self._source: Any = object()
+        
+        self.device_count = 0
+        self.average_confidence = 0
+        self.high = self.medium = self.low = 0
+        self.type_counts: dict[Any, int] = {}
+        self.zigbee_count = 0
+    
+    def refresh(self) -> None:
+        """Recompute the statistics unless this update was already counted."""
+        data = self._coordinator.data
+        if data is self._source and data is not None:
+            return
+        self._source = data
+        
+        devices = self._hub.get_all_devices()
+        
+        # Single pass: average over devices reporting a confidence,
+        # buckets over all devices (missing confidence counts as 0)
+        total = 0
+        reported = 0
+        high = medium = low = 0
+        type_counts = {}
+        zigbee_count = 0
+        count = type_counts.get
+        for device in devices:
+            confidence = device.get(ATTR_CONFIDENCE)
+            if confidence is None:
+                confidence = 0
+            else:
+                total += confidence
+                reported += 1
+            
+            if confidence >= 80:
+                high += 1
+            elif confidence >= 40:
+                medium += 1
+            else:
+                low += 1
+            
+            device_type = device.get("device_type", "unknown")
+            type_counts[device_type] = count(device_type, 0) + 1
+            if device.get("zigbee", False):
+                zigbee_count += 1
+        
+        self.device_count = len(devices)
+        self.average_confidence = round(total / reported) if reported else 0
+        self.high, self.medium, self.low = high, medium, low
+        self.type_counts = type_counts
+        self.zigbee_count = zigbee_count
+
+
 class HubConfidenceSensor(CoordinatorEntity, SensorEntity):
     """Overall state confidence sensor."""
     
@@ -71,47 +137,40 @@ class HubConfidenceSensor(CoordinatorEntity, SensorEntity):
         coordinator: DataUpdateCoordinator,
         hub: ICS2000Hub,
         config_entry_id: str,
+        device_info: DeviceInfo,
+        summary: _HubSummary,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._hub = hub
+        self._summary = summary
         self._attr_unique_id = f"{hub.mac}_confidence"
         self._attr_name = "State Confidence"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, hub.mac)},
-        )
+        self._attr_device_info = device_info
+        self._update_from_devices()
     
-    @property
-    def native_value(self) -> float:
-        """Return average confidence."""
-        devices = self._hub.get_all_devices()
-        if not devices:
-            return 0
-        
-        confidences = [
-            d.get(ATTR_CONFIDENCE, 0)
-            for d in devices
-            if ATTR_CONFIDENCE in d
-        ]
-        
-        return round(sum(confidences) / len(confidences)) if confidences else 0
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the summary once per coordinator update."""
+        self._update_from_devices()
+        super()._handle_coordinator_update()
     
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        devices = self._hub.get_all_devices()
+    def _update_from_devices(self) -> None:
+        """Read average confidence and confidence buckets from the summary."""
+        summary = self._summary
+        summary.refresh()
         
-        high = sum(1 for d in devices if d.get(ATTR_CONFIDENCE, 0) >= 80)
-        medium = sum(1 for d in devices if 40 <= d.get(ATTR_CONFIDENCE, 0) < 80)
-        low = sum(1 for d in devices if d.get(ATTR_CONFIDENCE, 0) < 40)
+        self._attr_native_value = summary.average_confidence
         
-        return {
+        high, medium, low = summary.high, summary.medium, summary.low
+        total = summary.device_count
+        self._attr_extra_state_attributes = {
             "high_confidence": high,
             "medium_confidence": medium,
             "low_confidence": low,
-            "high_percentage": round((high / len(devices) * 100) if devices else 0),
-            "medium_percentage": round((medium / len(devices) * 100) if devices else 0),
-            "low_percentage": round((low / len(devices) * 100) if devices else 0),
+            "high_percentage": round((high / total * 100) if total else 0),
+            "medium_percentage": round((medium / total * 100) if total else 0),
+            "low_percentage": round((low / total * 100) if total else 0),
         }
 
 
@@ -128,50 +187,58 @@ class HubDeviceCountSensor(CoordinatorEntity, SensorEntity):
         coordinator: DataUpdateCoordinator,
         hub: ICS2000Hub,
         config_entry_id: str,
+        device_info: DeviceInfo,
+        summary: _HubSummary,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._hub = hub
+        self._summary = summary
         self._attr_unique_id = f"{hub.mac}_device_count"
         self._attr_name = "Device Count"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, hub.mac)},
-        )
+        self._attr_device_info = device_info
+        self._device_attributes: dict[str, Any] = {}
+        self._update_from_devices()
     
-    @property
-    def native_value(self) -> int:
-        """Return device count."""
-        return len(self._hub.get_all_devices())
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the counts once per coordinator update."""
+        self._update_from_devices()
+        super()._handle_coordinator_update()
     
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        devices = self._hub.get_all_devices()
-        
-        type_counts = {}
-        for device in devices:
-            device_type = device.get("device_type", "unknown")
-            type_counts[device_type] = type_counts.get(device_type, 0) + 1
+    def _update_from_devices(self) -> None:
+        """Read device counts per type and radio from the summary."""
+        summary = self._summary
+        summary.refresh()
+        self._attr_native_value = summary.device_count
         
         # Add friendly names for counts
+        count = summary.type_counts.get
         friendly_counts = {
-            "lights": type_counts.get(DEVICE_TYPE_LIGHT, 0) + type_counts.get(DEVICE_TYPE_DIMMER, 0),
-            "switches": type_counts.get(DEVICE_TYPE_SWITCH, 0),
-            "covers": type_counts.get(DEVICE_TYPE_COVER, 0),
-            "sensors": type_counts.get(DEVICE_TYPE_SENSOR, 0),
+            "lights": count(DEVICE_TYPE_LIGHT, 0) + count(DEVICE_TYPE_DIMMER, 0),
+            "switches": count(DEVICE_TYPE_SWITCH, 0),
+            "covers": count(DEVICE_TYPE_COVER, 0),
+            "sensors": count(DEVICE_TYPE_SENSOR, 0),
         }
         
         # Count Zigbee vs 433MHz devices
-        zigbee_count = sum(1 for d in devices if d.get("zigbee", False))
-        rf433_count = len(devices) - zigbee_count
+        zigbee_count = summary.zigbee_count
+        rf433_count = summary.device_count - zigbee_count
         
-        return {
-            "connected": self._hub.connected,
-            "firmware": self._hub.firmware_version,
+        self._device_attributes = {
             "zigbee_devices": zigbee_count,
             "rf433_devices": rf433_count,
             **friendly_counts,
-            "raw_types": type_counts,
+            "raw_types": summary.type_counts,
+        }
+    
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra attributes."""
+        return {
+            "connected": self._hub.connected,
+            "firmware": self._hub.firmware_version,
+            **self._device_attributes,
         }
 
 
@@ -187,15 +254,14 @@ class HubConnectionSensor(CoordinatorEntity, SensorEntity):
         coordinator: DataUpdateCoordinator,
         hub: ICS2000Hub,
         config_entry_id: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._hub = hub
         self._attr_unique_id = f"{hub.mac}_connection"
         self._attr_name = "Connection Status"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, hub.mac)},
-        )
+        self._attr_device_info = device_info
     
     @property
     def native_value(self) -> str:
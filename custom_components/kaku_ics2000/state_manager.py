@@ -3,24 +3,34 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only fallback for devices without a stored state
+_EMPTY: Dict[str, Any] = {}
+
 
 class StateManager:
     """Manages device states for KlikAanKlikUit devices."""
     
+    __slots__ = ("_states", "_last_update")
+    
     def __init__(self) -> None:
         """Initialize the state manager."""
         self._states: Dict[int, Dict[str, Any]] = {}
-        self._last_update: Optional[datetime] = None
+        # Stored as a POSIX timestamp; converted to datetime only when read
+        self._last_update: Optional[float] = None
     
     def update_device_state(self, device_id: int, state: Dict[str, Any]) -> None:
-        """Update the state of a device."""
+        """Update the state of a device.
+        
+        The dict is stored without copying; callers must not mutate it afterwards.
+        """
         self._states[device_id] = state
-        self._last_update = datetime.now()
+        self._last_update = time.time()
         _LOGGER.debug(f"Updated state for device {device_id}: {state}")
     
     def get_device_state(self, device_id: int) -> Optional[Dict[str, Any]]:
@@ -40,19 +50,21 @@ class StateManager:
     @property
     def last_update(self) -> Optional[datetime]:
         """Get the last update time."""
-        return self._last_update
+        if self._last_update is None:
+            return None
+        return datetime.fromtimestamp(self._last_update)
     
     def is_device_on(self, device_id: int) -> bool:
         """Check if a device is on."""
-        state = self._states.get(device_id, {})
+        state = self._states.get(device_id, _EMPTY)
         return state.get("state", False)
     
     def get_device_brightness(self, device_id: int) -> Optional[int]:
         """Get the brightness of a device."""
-        state = self._states.get(device_id, {})
+        state = self._states.get(device_id, _EMPTY)
         return state.get("brightness")
     
     def get_device_position(self, device_id: int) -> Optional[int]:
         """Get the position of a cover device."""
-        state = self._states.get(device_id, {})
+        state = self._states.get(device_id, _EMPTY)
         return state.get("position")
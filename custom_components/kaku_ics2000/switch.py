@@ -7,7 +7,7 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -25,11 +25,15 @@ from .const import (
     ATTR_ZIGBEE,
     DEVICE_TYPE_SWITCH,
     DOMAIN,
+    MANUFACTURER,
 )
 from .hub import ICS2000Hub
 
 _LOGGER = logging.getLogger(__name__)
 
+# Name keyword -> device class; anything else (fans, speakers, ...) is a switch
+_MODEL_DEVICE_CLASSES = (("plug", SwitchDeviceClass.OUTLET),)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -55,11 +59,15 @@ async def async_setup_entry(
                     config_entry.entry_id,
                 )
             )
-            _LOGGER.info(f"Created switch entity for {device[ATTR_DEVICE_MODEL]} (ID: {device[ATTR_DEVICE_ID]})")
+            _LOGGER.debug(
+                "Created switch entity for %s (ID: %s)",
+                device[ATTR_DEVICE_MODEL],
+                device[ATTR_DEVICE_ID],
+            )
     
     if entities:
         async_add_entities(entities)
-        _LOGGER.info(f"Added {len(entities)} switch entities")
+        _LOGGER.info("Added %s switch entities", len(entities))
 
 
 class KakuSwitch(CoordinatorEntity, SwitchEntity):
@@ -81,7 +89,7 @@ class KakuSwitch(CoordinatorEntity, SwitchEntity):
         self._device_id = device_id
         self._config_entry_id = config_entry_id
         
-        # Get device info from hub
+        # Get device info from hub (refreshed on every coordinator update)
         self._device = hub.get_device(device_id) or {}
         
         # Set unique ID
@@ -93,42 +101,49 @@ class KakuSwitch(CoordinatorEntity, SwitchEntity):
         
         # Determine device class based on name
         model_lower = device_name.lower()
-        if "plug" in model_lower:
-            self._attr_device_class = SwitchDeviceClass.OUTLET
-        elif "fan" in model_lower:
-            self._attr_device_class = SwitchDeviceClass.SWITCH
-        elif "speaker" in model_lower:
-            self._attr_device_class = SwitchDeviceClass.SWITCH
-        else:
-            self._attr_device_class = SwitchDeviceClass.SWITCH
+        self._attr_device_class = next(
+            (
+                device_class
+                for keyword, device_class in _MODEL_DEVICE_CLASSES
+                if keyword in model_lower
+            ),
+            SwitchDeviceClass.SWITCH,
+        )
         
         # Set device info with proper name
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{hub.mac}_{device_id}")},
             name=device_name,
-            manufacturer="KlikAanKlikUit",
+            manufacturer=MANUFACTURER,
             model=self._device.get(ATTR_DEVICE_MODEL, "Switch"),
-            via_device=(DOMAIN, hub.mac),
+            via_device=hub.via_device,
         )
         
         # We have real state tracking now!
         self._attr_assumed_state = False
+        
+        self._attr_extra_state_attributes = self._build_attributes()
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the hub device and its attributes once per coordinator update."""
+        self._device = self._hub.get_device(self._device_id) or {}
+        self._attr_extra_state_attributes = self._build_attributes()
+        super()._handle_coordinator_update()
     
     @property
     def is_on(self) -> bool:
         """Return true if switch is on."""
-        device = self._hub.get_device(self._device_id)
-        return device.get("state", False) if device else False
+        return self._device.get("state", False)
     
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return self._hub.connected
     
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        device = self._hub.get_device(self._device_id)
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the extra state attributes from the cached device."""
+        device = self._device
         if not device:
             return {}
         
@@ -160,12 +175,14 @@ class KakuSwitch(CoordinatorEntity, SwitchEntity):
         """Turn on the switch."""
         await self._hub.async_turn_on(self._device_id)
         
-        # Request coordinator refresh
-        await self.coordinator.async_request_refresh()
+        # Update optimistically; the next poll confirms the state
+        self._device["state"] = True
+        self.async_write_ha_state()
     
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
         await self._hub.async_turn_off(self._device_id)
         
-        # Request coordinator refresh
-        await self.coordinator.async_request_refresh()
\ No newline at end of file
+        # Update optimistically; the next poll confirms the state
+        self._device["state"] = False
+        self.async_write_ha_state()
\ No newline at end of file
@@ -10,61 +10,47 @@ import urllib.request
 import urllib.parse
 import ssl
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 
-def decrypt_kaku_data(encrypted_b64, aes_key_hex):
-    """Decrypt KlikAanKlikUit data."""
+ZERO_IV = b'\x00' * 16
+
+# Valid PKCS7 padding tails, indexed by pad length
+PKCS7_PADDING = tuple(bytes((n,)) * n for n in range(17))
+
+def decrypt_kaku_data(encrypted_b64, aes):
+    """Decrypt KlikAanKlikUit data with a shared algorithms.AES key."""
     try:
-        aes_key = bytes.fromhex(aes_key_hex)
         encrypted = base64.b64decode(encrypted_b64)
         
-        # Use CBC mode with zero IV
-        iv = b'\x00' * 16
-        cipher = Cipher(algorithms.AES(aes_key), modes.CBC(iv), backend=default_backend())
+        # Use CBC mode with zero IV; each call needs its own decryptor
+        cipher = Cipher(aes, modes.CBC(ZERO_IV), backend=default_backend())
         decryptor = cipher.decryptor()
         decrypted = decryptor.update(encrypted) + decryptor.finalize()
         
+        # Remove PKCS#7 padding if present
+        pad_len = decrypted[-1] if decrypted else 0
+        if 0 < pad_len <= 16 and decrypted.endswith(PKCS7_PADDING[pad_len]):
+            decrypted = decrypted[:-pad_len]
+        
         # Find JSON start
-        for i in range(len(decrypted)):
-            if decrypted[i:i+1] in [b'{', b'[']:
-                json_bytes = decrypted[i:]
-                
-                # Remove padding if present
-                if len(json_bytes) > 0:
-                    pad_len = json_bytes[-1]
-                    if isinstance(pad_len, int) and 0 < pad_len <= 16:
-                        if all(b == pad_len for b in json_bytes[-pad_len:]):
-                            json_bytes = json_bytes[:-pad_len]
-                
-                # Decode and extract valid JSON
-                json_str = json_bytes.decode('utf-8', errors='ignore')
-                
-                # Find end of JSON
-                depth = 0
-                end_pos = 0
-                for j, char in enumerate(json_str):
-                    if char in '{[':
-                        depth += 1
-                    elif char in '}]':
-                        depth -= 1
-                        if depth == 0:
-                            end_pos = j + 1
-                            break
-                
-                if end_pos > 0:
-                    json_str = json_str[:end_pos]
-                    return json.loads(json_str)
-                break
+        starts = [pos for pos in (decrypted.find(b'{'), decrypted.find(b'[')) if pos != -1]
+        if starts:
+            json_str = decrypted[min(starts):].decode('utf-8', errors='ignore')
+            
+            # Parse up to the end of the JSON value
+            data, _ = json.JSONDecoder().raw_decode(json_str)
+            return data
     except Exception as e:
         print(f"Decryption error: {e}")
     return None
 
-def extract_device_name(module_data, aes_key_hex):
+def extract_device_name(module_data, aes):
     """Extract device name from module data."""
     # Try the 'data' field first (this usually contains the name)
     if 'data' in module_data and module_data['data']:
-        decrypted = decrypt_kaku_data(module_data['data'], aes_key_hex)
+        decrypted = decrypt_kaku_data(module_data['data'], aes)
         
         if decrypted and 'module' in decrypted:
             module = decrypted['module']
@@ -85,7 +71,7 @@ def extract_device_name(module_data, aes_key_hex):
     
     # Fallback to status field
     if 'status' in module_data and module_data['status']:
-        decrypted = decrypt_kaku_data(module_data['status'], aes_key_hex)
+        decrypted = decrypt_kaku_data(module_data['status'], aes)
         
         if decrypted and 'module' in decrypted:
             module = decrypted['module']
@@ -183,12 +169,18 @@ def main():
                 success_count = 0
                 failed_count = 0
                 
-                for idx, module_data in enumerate(sync_response):
+                # Expand the key once and decrypt the modules in parallel;
+                # cryptography releases the GIL while decrypting
+                aes = algorithms.AES(bytes.fromhex(aes_key_hex))
+                with ThreadPoolExecutor() as executor:
+                    device_names = list(executor.map(
+                        lambda module: extract_device_name(module, aes),
+                        sync_response,
+                    ))
+                
+                for module_data, device_name in zip(sync_response, device_names):
                     module_id = module_data.get('id', 'unknown')
                     
-                    # Try to extract the device name
-                    device_name = extract_device_name(module_data, aes_key_hex)
-                    
                     if device_name and device_name != f"Device {module_id}":
                         print(f"✅ Module {module_id}: '{device_name}'")
                         success_count += 1
@@ -6,9 +6,8 @@ Shows what devices are actually configured in your system
 
 import json
 import base64
-import ssl
-import urllib.request
-import urllib.parse
+
+from _test_common import close_connections, encode_sync, login, sync
 
 def main():
     print("=== ICS-2000 Device Fetcher ===\n")
@@ -18,49 +17,32 @@ def main():
     email = input("Enter your email: ").strip()
     password = input("Enter your password: ").strip()
     
-    # Create SSL context
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    
+    # Both requests share one pooled keep-alive connection
+    try:
+        fetch_devices(email, password)
+    finally:
+        close_connections()
+
+def fetch_devices(email, password):
+    """Authenticate, fetch the encrypted device data and save it to disk."""
     print("\n1. Authenticating...")
     
     # Step 1: Authenticate
-    login_data = {
-        'action': 'login',
-        'email': email,
-        'password_hash': password,
-        'device_unique_id': 'android',
-        'platform': '',
-        'mac': '',
-    }
-    
     try:
-        data = urllib.parse.urlencode(login_data).encode('utf-8')
-        req = urllib.request.Request(
-            "https://trustsmartcloud2.com/ics2000_api/account.php",
-            data=data,
-            method='POST'
-        )
+        home = login(email, password)
+        if home is None:
+            print("❌ No homes found in account")
+            return
+        
+        home_id = home['home_id']
+        gateway_mac = home['mac']
+        aes_key_hex = home['aes_key']
+        
+        print(f"✅ Authenticated successfully")
+        print(f"   Home ID: {home_id}")
+        print(f"   Gateway MAC: {gateway_mac}")
+        print(f"   AES Key: {aes_key_hex}")
         
-        with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
-            auth_text = response.read().decode('utf-8')
-            auth_data = json.loads(auth_text)
-            
-            if 'homes' not in auth_data or not auth_data['homes']:
-                print("❌ No homes found in account")
-                return
-            
-            home = auth_data['homes'][0]
-            home_id = home['home_id']
-            gateway_mac = home['mac']
-            aes_key_hex = home['aes_key']
-            
-            print(f"✅ Authenticated successfully")
-            print(f"   Home ID: {home_id}")
-            print(f"   Gateway MAC: {gateway_mac}")
-            print(f"   AES Key: {aes_key_hex}")
-            
     except Exception as e:
         print(f"❌ Authentication failed: {e}")
         return
@@ -68,42 +50,25 @@ def main():
     print("\n2. Fetching device data...")
     
     # Step 2: Fetch encrypted device data
-    sync_data = {
-        'email': email,
-        'mac': gateway_mac,
-        'action': 'sync',
-        'password_hash': password,
-        'home_id': home_id,
-    }
-    
     try:
-        data = urllib.parse.urlencode(sync_data).encode('utf-8')
-        req = urllib.request.Request(
-            "https://trustsmartcloud2.com/ics2000_api/gateway.php",
-            data=data,
-            method='POST'
-        )
+        sync_data = sync(encode_sync(email, password, home))
+        
+        if not sync_data:
+            print("❌ No data returned from gateway")
+            return
+        
+        gateway_data = sync_data[0] if isinstance(sync_data, list) else sync_data
+        
+        print(f"✅ Got encrypted data")
+        
+        # Get encrypted fields
+        encrypted_status = gateway_data.get('status', '')
+        encrypted_data = gateway_data.get('data', '')
+        
+        print(f"\n3. Encrypted data received:")
+        print(f"   Status length: {len(encrypted_status)} chars")
+        print(f"   Data length: {len(encrypted_data)} chars")
         
-        with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
-            sync_text = response.read().decode('utf-8')
-            sync_data = json.loads(sync_text)
-            
-            if not sync_data:
-                print("❌ No data returned from gateway")
-                return
-            
-            gateway_data = sync_data[0] if isinstance(sync_data, list) else sync_data
-            
-            print(f"✅ Got encrypted data")
-            
-            # Get encrypted fields
-            encrypted_status = gateway_data.get('status', '')
-            encrypted_data = gateway_data.get('data', '')
-            
-            print(f"\n3. Encrypted data received:")
-            print(f"   Status length: {len(encrypted_status)} chars")
-            print(f"   Data length: {len(encrypted_data)} chars")
-            
     except Exception as e:
         print(f"❌ Device fetch failed: {e}")
         return
@@ -4,9 +4,13 @@ Test different parameters with gateway.php to see if we can get unencrypted devi
 """
 
 import json
-import ssl
-import urllib.request
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from _test_common import GATEWAY_URL, close_connections, json_loads, login, post_form
+
+# Probes are independent and network-bound, so they run on a thread pool
+PROBE_WORKERS = 8
+_executor = ThreadPoolExecutor(max_workers=PROBE_WORKERS)
 
 def test_gateway_parameters():
     """Test different parameter combinations with gateway.php."""
@@ -20,215 +24,141 @@ def test_gateway_parameters():
     # First authenticate to get details
     print("\n1. Authenticating...")
     
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    
-    login_data = {
-        'action': 'login',
-        'email': email,
-        'password_hash': password,
-        'device_unique_id': 'android',
-        'platform': '',
-        'mac': '',
-    }
-    
     try:
-        data = urllib.parse.urlencode(login_data).encode('utf-8')
-        req = urllib.request.Request(
-            "https://trustsmartcloud2.com/ics2000_api/account.php",
-            data=data,
-            method='POST'
-        )
+        home = login(email, password)
+        if home is None:
+            print("❌ No homes found")
+            return
+        
+        home_id = home['home_id']
+        gateway_mac = home['mac']
+        aes_key = home['aes_key']
+        
+        print(f"✅ Authenticated")
+        print(f"   Home ID: {home_id}")
+        print(f"   Gateway MAC: {gateway_mac}")
         
-        with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
-            auth_text = response.read().decode('utf-8')
-            auth_data = json.loads(auth_text)
-            
-            if 'homes' not in auth_data or not auth_data['homes']:
-                print("❌ No homes found")
-                return
-            
-            home = auth_data['homes'][0]
-            home_id = home['home_id']
-            gateway_mac = home['mac']
-            aes_key = home['aes_key']
-            
-            print(f"✅ Authenticated")
-            print(f"   Home ID: {home_id}")
-            print(f"   Gateway MAC: {gateway_mac}")
-            
     except Exception as e:
         print(f"❌ Auth failed: {e}")
         return
     
     print("\n2. Testing different gateway.php parameters...")
     
-    # Different parameter combinations to try
-    test_params = [
-        # Original working params
-        {
+    def gateway_params(action='sync', password_field='password_hash', **extra):
+        """Build gateway.php parameters on top of the common account fields."""
+        return {
             'email': email,
             'mac': gateway_mac,
-            'action': 'sync',
-            'password_hash': password,
+            'action': action,
+            password_field: password,
             'home_id': home_id,
-        },
+            **extra,
+        }
+    
+    # Different parameter combinations to try
+    test_params = [
+        # Original working params
+        gateway_params(),
         # Try with format parameter
-        {
-            'email': email,
-            'mac': gateway_mac,
-            'action': 'sync',
-            'password_hash': password,
-            'home_id': home_id,
-            'format': 'json',
-        },
+        gateway_params(format='json'),
         # Try with decrypt flag
-        {
-            'email': email,
-            'mac': gateway_mac,
-            'action': 'sync',
-            'password_hash': password,
-            'home_id': home_id,
-            'decrypt': '1',
-        },
+        gateway_params(decrypt='1'),
         # Try with raw flag
-        {
-            'email': email,
-            'mac': gateway_mac,
-            'action': 'sync',
-            'password_hash': password,
-            'home_id': home_id,
-            'raw': '1',
-        },
+        gateway_params(raw='1'),
         # Try get_devices action
-        {
-            'email': email,
-            'mac': gateway_mac,
-            'action': 'get_devices',
-            'password_hash': password,
-            'home_id': home_id,
-        },
+        gateway_params('get_devices'),
         # Try list action
-        {
-            'email': email,
-            'mac': gateway_mac,
-            'action': 'list',
-            'password_hash': password,
-            'home_id': home_id,
-        },
+        gateway_params('list'),
         # Try with AES key included
-        {
-            'email': email,
-            'mac': gateway_mac,
-            'action': 'sync',
-            'password_hash': password,
-            'home_id': home_id,
-            'aes_key': aes_key,
-        },
+        gateway_params(aes_key=aes_key),
         # Try with version parameter
-        {
-            'email': email,
-            'mac': gateway_mac,
-            'action': 'sync',
-            'password_hash': password,
-            'home_id': home_id,
-            'version': '2',
-        },
+        gateway_params(version='2'),
         # Try plain password field
-        {
-            'email': email,
-            'mac': gateway_mac,
-            'action': 'sync',
-            'password': password,
-            'home_id': home_id,
-        },
+        gateway_params(password_field='password'),
     ]
     
-    for i, params in enumerate(test_params):
+    # Send all probes at once and report the results in order
+    futures = [
+        _executor.submit(post_form, GATEWAY_URL, params)
+        for params in test_params
+    ]
+    
+    for i, (params, future) in enumerate(zip(test_params, futures)):
         print(f"\n--- Test {i+1}: {list(params.keys())} ---")
         
         try:
-            data = urllib.parse.urlencode(params).encode('utf-8')
-            req = urllib.request.Request(
-                "https://trustsmartcloud2.com/ics2000_api/gateway.php",
-                data=data,
-                method='POST'
-            )
+            text = future.result()
             
-            with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
-                text = response.read().decode('utf-8')
-                
-                # Check response format
-                if text.startswith('['):
-                    print("  Response format: JSON array")
-                elif text.startswith('{'):
-                    print("  Response format: JSON object")
-                else:
-                    print(f"  Response format: Other ({text[:20]}...)")
+            # Check response format
+            if text.startswith('['):
+                print("  Response format: JSON array")
+            elif text.startswith('{'):
+                print("  Response format: JSON object")
+            else:
+                print(f"  Response format: Other ({text[:20]}...)")
+            
+            # Try to parse
+            try:
+                data = json_loads(text)
                 
-                # Try to parse
-                try:
-                    data = json.loads(text)
+                # Check structure
+                if isinstance(data, list) and data:
+                    item = data[0]
+                    print(f"  First item keys: {list(item.keys())}")
                     
-                    # Check structure
-                    if isinstance(data, list) and data:
-                        item = data[0]
-                        print(f"  First item keys: {list(item.keys())}")
-                        
-                        # Check if we have unencrypted entities
-                        if 'entities' in item:
-                            print("  ✅ Found 'entities' key directly!")
-                            entities = item['entities']
-                            if entities:
-                                print(f"  → {len(entities)} entities")
-                                print(f"  → First entity: {entities[0]}")
-                            return
-                        
-                        # Check data field
-                        if 'data' in item:
-                            data_field = item['data']
-                            # Check if data is already JSON
-                            if isinstance(data_field, dict):
-                                print("  ✅ 'data' field is already a dict!")
-                                if 'entities' in data_field:
-                                    print(f"  → Found {len(data_field['entities'])} entities")
-                                return
-                            elif isinstance(data_field, str):
-                                # Check if it's JSON string
-                                if data_field.startswith('{') or data_field.startswith('['):
-                                    try:
-                                        parsed = json.loads(data_field)
-                                        print("  ✅ 'data' field is JSON string!")
-                                        if 'entities' in parsed:
-                                            print(f"  → Found {len(parsed['entities'])} entities")
-                                        return
-                                    except:
-                                        pass
-                                
-                                # Check length to see if encrypted
-                                if len(data_field) > 100:
-                                    print(f"  'data' is long string ({len(data_field)} chars) - likely encrypted")
-                                else:
-                                    print(f"  'data' is short string: {data_field}")
+                    # Check if we have unencrypted entities
+                    if 'entities' in item:
+                        print("  ✅ Found 'entities' key directly!")
+                        entities = item['entities']
+                        if entities:
+                            print(f"  → {len(entities)} entities")
+                            print(f"  → First entity: {entities[0]}")
+                        return
                     
-                    elif isinstance(data, dict):
-                        print(f"  Response keys: {list(data.keys())}")
-                        
-                        if 'entities' in data:
-                            print("  ✅ Found 'entities' key directly!")
-                            print(f"  → {len(data['entities'])} entities")
-                            if data['entities']:
-                                print(f"  → First entity: {data['entities'][0]}")
+                    # Check data field
+                    if 'data' in item:
+                        data_field = item['data']
+                        # Check if data is already JSON
+                        if isinstance(data_field, dict):
+                            print("  ✅ 'data' field is already a dict!")
+                            if 'entities' in data_field:
+                                print(f"  → Found {len(data_field['entities'])} entities")
                             return
+                        elif isinstance(data_field, str):
+                            # Check if it's JSON string
+                            if data_field.startswith('{') or data_field.startswith('['):
+                                try:
+                                    parsed = json_loads(data_field)
+                                    print("  ✅ 'data' field is JSON string!")
+                                    if 'entities' in parsed:
+                                        print(f"  → Found {len(parsed['entities'])} entities")
+                                    return
+                                except:
+                                    pass
+                            
+                            # Check length to see if encrypted
+                            if len(data_field) > 100:
+                                print(f"  'data' is long string ({len(data_field)} chars) - likely encrypted")
+                            else:
+                                print(f"  'data' is short string: {data_field}")
+                
+                elif isinstance(data, dict):
+                    print(f"  Response keys: {list(data.keys())}")
                     
-                except json.JSONDecodeError:
-                    print("  Not valid JSON")
-                    # Check if response contains readable text
-                    if 'entity' in text.lower() or 'device' in text.lower():
-                        print("  But contains device-related keywords!")
-                        print(f"  Preview: {text[:200]}")
+                    if 'entities' in data:
+                        print("  ✅ Found 'entities' key directly!")
+                        print(f"  → {len(data['entities'])} entities")
+                        if data['entities']:
+                            print(f"  → First entity: {data['entities'][0]}")
+                        return
                 
+            except json.JSONDecodeError:
+                print("  Not valid JSON")
+                # Check if response contains readable text
+                if 'entity' in text.lower() or 'device' in text.lower():
+                    print("  But contains device-related keywords!")
+                    print(f"  Preview: {text[:200]}")
+            
         except Exception as e:
             print(f"  Error: {e}")
     
@@ -248,35 +178,42 @@ def test_gateway_parameters():
         'home_id': home_id,
     }
     
+    actions = ['sync', 'get', 'list', '']
+    futures = {}
     for endpoint in other_endpoints:
-        print(f"\n--- Testing {endpoint.split('/')[-1]} ---")
-        
-        for action in ['sync', 'get', 'list', '']:
+        for action in actions:
             params = base_params.copy()
             if action:
                 params['action'] = action
-            
+            futures[endpoint, action] = _executor.submit(
+                post_form, endpoint, params, 5
+            )
+    
+    for endpoint in other_endpoints:
+        print(f"\n--- Testing {endpoint.split('/')[-1]} ---")
+        
+        for action in actions:
             try:
-                data = urllib.parse.urlencode(params).encode('utf-8')
-                req = urllib.request.Request(endpoint, data=data, method='POST')
+                text = futures[endpoint, action].result()
                 
-                with urllib.request.urlopen(req, context=ctx, timeout=5) as response:
-                    text = response.read().decode('utf-8')
+                if 'entity' in text.lower() or 'device' in text.lower():
+                    print(f"  ✅ Action '{action}' returned device data!")
+                    print(f"  Preview: {text[:200]}")
+                    
+                    try:
+                        parsed = json_loads(text)
+                        if 'entities' in parsed:
+                            print(f"  → Found {len(parsed['entities'])} entities!")
+                            return
+                    except:
+                        pass
                     
-                    if 'entity' in text.lower() or 'device' in text.lower():
-                        print(f"  ✅ Action '{action}' returned device data!")
-                        print(f"  Preview: {text[:200]}")
-                        
-                        try:
-                            parsed = json.loads(text)
-                            if 'entities' in parsed:
-                                print(f"  → Found {len(parsed['entities'])} entities!")
-                                return
-                        except:
-                            pass
-                        
             except:
                 pass
 
 if __name__ == "__main__":
-    test_gateway_parameters()
+    try:
+        test_gateway_parameters()
+    finally:
+        _executor.shutdown(cancel_futures=True)
+        close_connections()
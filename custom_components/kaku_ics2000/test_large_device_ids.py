@@ -3,12 +3,16 @@
 Test different command formats for large device IDs
 """
 
+import argparse
 import socket
 import struct
 import time
 
-def test_command_formats(ip, mac, device_id):
-    """Test different packet formats for large device IDs."""
+def test_command_formats(ip, mac, device_id, wait=None):
+    """Test different packet formats for large device IDs.
+    
+    With wait set, pause that many seconds per format instead of prompting.
+    """
     
     mac_clean = mac.replace(":", "").upper()
     mac_bytes = bytes.fromhex(mac_clean)
@@ -20,60 +24,30 @@ def test_command_formats(ip, mac, device_id):
     
     formats = []
     
+    def build_packet(header, device_bytes):
+        """Build header + MAC + device ID + ON command, followed by a checksum."""
+        body = header + mac_bytes + device_bytes + b'\x01\x00'  # ON
+        return body + bytes((sum(body) & 0xFF,))
+    
     # Format 1: Original (only last byte)
-    packet1 = bytearray()
-    packet1.extend(b'\xAA\xAA')
-    packet1.extend(mac_bytes)
-    packet1.append(device_id & 0xFF)  # Only last byte
-    packet1.append(0x01)  # ON
-    packet1.append(0x00)
-    checksum = sum(packet1) & 0xFF
-    packet1.append(checksum)
-    formats.append(("Original (last byte only)", bytes(packet1)))
+    formats.append(("Original (last byte only)",
+                    build_packet(b'\xAA\xAA', struct.pack('>B', device_id & 0xFF))))
     
     # Format 2: 2-byte device ID
-    packet2 = bytearray()
-    packet2.extend(b'\xAA\xAA')
-    packet2.extend(mac_bytes)
-    packet2.extend(struct.pack('>H', device_id & 0xFFFF))  # 2 bytes, big-endian
-    packet2.append(0x01)  # ON
-    packet2.append(0x00)
-    checksum = sum(packet2) & 0xFF
-    packet2.append(checksum)
-    formats.append(("2-byte device ID (big-endian)", bytes(packet2)))
+    formats.append(("2-byte device ID (big-endian)",
+                    build_packet(b'\xAA\xAA', struct.pack('>H', device_id & 0xFFFF))))
     
     # Format 3: 4-byte device ID
-    packet3 = bytearray()
-    packet3.extend(b'\xAA\xAA')
-    packet3.extend(mac_bytes)
-    packet3.extend(struct.pack('>I', device_id))  # 4 bytes, big-endian
-    packet3.append(0x01)  # ON
-    packet3.append(0x00)
-    checksum = sum(packet3) & 0xFF
-    packet3.append(checksum)
-    formats.append(("4-byte device ID (big-endian)", bytes(packet3)))
+    formats.append(("4-byte device ID (big-endian)",
+                    build_packet(b'\xAA\xAA', struct.pack('>I', device_id))))
     
     # Format 4: Little-endian 4-byte
-    packet4 = bytearray()
-    packet4.extend(b'\xAA\xAA')
-    packet4.extend(mac_bytes)
-    packet4.extend(struct.pack('<I', device_id))  # 4 bytes, little-endian
-    packet4.append(0x01)  # ON
-    packet4.append(0x00)
-    checksum = sum(packet4) & 0xFF
-    packet4.append(checksum)
-    formats.append(("4-byte device ID (little-endian)", bytes(packet4)))
+    formats.append(("4-byte device ID (little-endian)",
+                    build_packet(b'\xAA\xAA', struct.pack('<I', device_id))))
     
     # Format 5: Different header
-    packet5 = bytearray()
-    packet5.extend(b'\x5A\x5A')  # Different header
-    packet5.extend(mac_bytes)
-    packet5.extend(struct.pack('>I', device_id))
-    packet5.append(0x01)  # ON
-    packet5.append(0x00)
-    checksum = sum(packet5) & 0xFF
-    packet5.append(checksum)
-    formats.append(("Different header (5A5A)", bytes(packet5)))
+    formats.append(("Different header (5A5A)",
+                    build_packet(b'\x5A\x5A', struct.pack('>I', device_id))))
     
     # Format 6: JSON command
     import json
@@ -84,40 +58,56 @@ def test_command_formats(ip, mac, device_id):
     })
     formats.append(("JSON format", json_cmd.encode()))
     
-    # Test each format
-    for description, packet in formats:
-        print(f"\nTesting: {description}")
-        print(f"Packet: {packet.hex() if isinstance(packet, bytes) else packet[:50]}")
+    # One UDP socket, connected once, is reused for every format
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.settimeout(1.0)
+        sock.connect((ip, 9760))
         
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(1.0)
-            
-            # Send 3 times
-            for _ in range(3):
-                sock.sendto(packet, (ip, 9760))
-                time.sleep(0.1)
-            
-            sock.close()
-            print("✓ Sent successfully")
+        # Test each format
+        for description, packet in formats:
+            print(f"\nTesting: {description}")
+            print(f"Packet: {packet.hex() if isinstance(packet, bytes) else packet[:50]}")
             
-            # Wait to see if light turns on
-            input("Check if the light turned on, then press Enter to continue...")
-            
-        except Exception as e:
-            print(f"✗ Error: {e}")
+            try:
+                # Send 3 times back-to-back
+                for _ in range(3):
+                    sock.send(packet)
+                
+                print("✓ Sent successfully")
+                
+                # Wait to see if light turns on
+                if wait is None:
+                    input("Check if the light turned on, then press Enter to continue...")
+                else:
+                    time.sleep(wait)
+                
+            except Exception as e:
+                print(f"✗ Error: {e}")
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Test command formats for large device IDs")
+    parser.add_argument("--ip", help="ICS-2000 IP address (prompted if omitted)")
+    parser.add_argument("--mac", help="ICS-2000 MAC address (prompted if omitted)")
+    parser.add_argument("--auto", action="store_true",
+                        help="don't prompt after each format, just wait")
+    parser.add_argument("--wait", type=float, default=3.0,
+                        help="seconds to wait per format with --auto (default: 3)")
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+    
     print("=== Testing Command Formats for Large Device IDs ===\n")
     
-    ip = input("Enter ICS-2000 IP (default: 192.168.0.39): ").strip() or "192.168.0.39"
-    mac = input("Enter MAC address: ").strip()
+    ip = args.ip or input("Enter ICS-2000 IP (default: 192.168.0.39): ").strip() or "192.168.0.39"
+    mac = args.mac or input("Enter MAC address: ").strip()
     
     # Test Office Right
     device_id = 26087308
     
     print(f"\nTesting Office Right (ID: {device_id})")
-    test_command_formats(ip, mac, device_id)
+    test_command_formats(ip, mac, device_id, args.wait if args.auto else None)
     
     print("\n" + "="*60)
     print("If none worked, the large IDs might:")
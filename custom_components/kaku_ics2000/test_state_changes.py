@@ -1,201 +1,190 @@
 #!/usr/bin/env python3
 """
 Test if cloud data changes when device state changes
+
+Usage: test_state_changes.py [module_id] [--auto] [--wait SECONDS]
 """
 
+import argparse
 import json
 import base64
-import ssl
-import urllib.request
-import urllib.parse
+import itertools
 import time
-import hashlib
+import zlib
+
+from _test_common import close_connections, encode_sync, login, sync
+
+try:
+    from Crypto.Cipher import AES as CryptodomeAES
+except ImportError:  # PyCryptodome is optional
+    CryptodomeAES = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+# Module fields compared between captures, in report order
+TRACKED_FIELDS = ('version_status', 'version_data', 'status', 'data')
+
+# Encrypted fields and how much of their decrypted JSON to print
+ENCRYPTED_PREVIEW = {'status': None, 'data': 200}
+
+# Valid PKCS7 padding tails, indexed by pad length
+PKCS7_PADDING = tuple(bytes((n,)) * n for n in range(17))
+
+def fetch_modules(sync_body):
+    """Fetch all modules with one sync call, indexed by module id."""
+    return {module.get('id'): module for module in sync(sync_body)}
 
-def get_module_data(email, password, home_id, gateway_mac, module_id):
+def get_module_data(sync_body, module_id):
     """Get current data for a specific module."""
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    
-    sync_data = {
-        'email': email,
-        'mac': gateway_mac,
-        'action': 'sync',
-        'password_hash': password,
-        'home_id': home_id,
-    }
-    
     try:
-        data = urllib.parse.urlencode(sync_data).encode('utf-8')
-        req = urllib.request.Request(
-            "https://trustsmartcloud2.com/ics2000_api/gateway.php",
-            data=data,
-            method='POST'
-        )
-        
-        with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
-            sync_text = response.read().decode('utf-8')
-            sync_response = json.loads(sync_text)
-            
-            # Find the specific module
-            for module in sync_response:
-                if module.get('id') == str(module_id):
-                    return module
-            
-            return None
-            
+        modules = fetch_modules(sync_body)
+        return modules.get(str(module_id))
     except Exception as e:
         print(f"Error fetching data: {e}")
         return None
 
-def decrypt_field(encrypted_b64, aes_key_hex):
-    """Decrypt a field."""
+def decrypt_field(encrypted_b64, aes_key):
+    """Decrypt a field with the raw AES key."""
     try:
-        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-        from cryptography.hazmat.backends import default_backend
-        
-        aes_key = bytes.fromhex(aes_key_hex)
         encrypted = base64.b64decode(encrypted_b64)
         
         iv = b'\x00' * 16
-        cipher = Cipher(algorithms.AES(aes_key), modes.CBC(iv), backend=default_backend())
-        decryptor = cipher.decryptor()
-        decrypted = decryptor.update(encrypted) + decryptor.finalize()
+        if CryptodomeAES is not None:
+            # PyCryptodome decrypts in a single call
+            decrypted = CryptodomeAES.new(aes_key, CryptodomeAES.MODE_CBC, iv=iv).decrypt(encrypted)
+        else:
+            from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+            from cryptography.hazmat.backends import default_backend
+            
+            cipher = Cipher(algorithms.AES(aes_key), modes.CBC(iv), backend=default_backend())
+            decryptor = cipher.decryptor()
+            decrypted = decryptor.update(encrypted) + decryptor.finalize()
         
-        # Find JSON
-        for i in range(len(decrypted)):
-            if decrypted[i:i+1] in [b'{', b'[']:
-                json_bytes = decrypted[i:]
-                
-                # Remove padding
-                if len(json_bytes) > 0:
-                    pad_len = json_bytes[-1]
-                    if isinstance(pad_len, int) and pad_len < 16:
-                        if all(b == pad_len for b in json_bytes[-pad_len:]):
-                            json_bytes = json_bytes[:-pad_len]
-                
-                json_text = json_bytes.decode('utf-8', errors='ignore')
-                
-                # Find end
-                depth = 0
-                for j, char in enumerate(json_text):
-                    if char == '{':
-                        depth += 1
-                    elif char == '}':
-                        depth -= 1
-                        if depth == 0:
-                            return json.loads(json_text[:j+1])
+        # Remove PKCS#7 padding by moving the end index instead of copying
+        end = len(decrypted)
+        pad_len = decrypted[-1] if decrypted else 0
+        if 0 < pad_len <= 16 and decrypted.endswith(PKCS7_PADDING[pad_len]):
+            end -= pad_len
+        
+        # Find JSON start and parse up to the end of the value
+        starts = [
+            pos for pos in (decrypted.find(b'{', 0, end), decrypted.find(b'[', 0, end))
+            if pos != -1
+        ]
+        if starts:
+            # Decode straight from a memoryview so no byte slice is copied
+            json_text = str(memoryview(decrypted)[min(starts):end], 'utf-8', 'ignore')
+            data, _ = json.JSONDecoder().raw_decode(json_text)
+            return data
         
     except:
         pass
     return None
 
+def compact_json(obj):
+    """Serialize an object to compact JSON text for previews."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+def get_device_name(module_data, aes_key):
+    """Decrypt a module's data field to find its name."""
+    name = f"Device {module_data.get('id')}"
+    encrypted_data = module_data.get('data')
+    if encrypted_data:
+        decrypted = decrypt_field(encrypted_data, aes_key)
+        if decrypted and 'module' in decrypted:
+            name = decrypted['module'].get('name', name)
+    return name
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Test if cloud data changes when device state changes")
+    parser.add_argument("module_id", nargs="?",
+                        help="module to monitor (skips the device list)")
+    parser.add_argument("--auto", action="store_true",
+                        help="don't wait for Enter after the state change, just sleep")
+    parser.add_argument("--wait", type=float, default=10.0,
+                        help="seconds to sleep with --auto (default: 10)")
+    args = parser.parse_args()
+    if args.auto and args.module_id is None:
+        parser.error("--auto needs a module_id")
+    return args
+
 def main():
+    args = parse_args()
+    
     print("=== ICS-2000 State Change Detector ===\n")
     print("This will monitor a device to see if cloud data changes when state changes.\n")
     
     email = input("Enter email: ").strip()
     password = input("Enter password: ").strip()
     
-    ctx = ssl.create_default_context()
-    ctx.check_hostname = False
-    ctx.verify_mode = ssl.CERT_NONE
-    
     # Authenticate
     print("\nAuthenticating...")
-    login_data = {
-        'action': 'login',
-        'email': email,
-        'password_hash': password,
-        'device_unique_id': 'android',
-        'platform': '',
-        'mac': '',
-    }
-    
     try:
-        data = urllib.parse.urlencode(login_data).encode('utf-8')
-        req = urllib.request.Request(
-            "https://trustsmartcloud2.com/ics2000_api/account.php",
-            data=data,
-            method='POST'
-        )
+        home = login(email, password)
+        if home is None:
+            print("❌ No homes found")
+            return
+        
+        aes_key = bytes.fromhex(home['aes_key'])
+        
+        print(f"✅ Authenticated")
         
-        with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
-            auth_text = response.read().decode('utf-8')
-            auth_data = json.loads(auth_text)
-            
-            home = auth_data['homes'][0]
-            home_id = home['home_id']
-            gateway_mac = home['mac']
-            aes_key_hex = home['aes_key']
-            
-            print(f"✅ Authenticated")
-            
     except Exception as e:
         print(f"❌ Auth failed: {e}")
         return
     
+    # The sync request body is the same for every fetch, so encode it once
+    sync_body = encode_sync(email, password, home)
+    
     # List available devices
     print("\nFetching devices...")
-    sync_data = {
-        'email': email,
-        'mac': gateway_mac,
-        'action': 'sync',
-        'password_hash': password,
-        'home_id': home_id,
-    }
-    
-    devices = []
     
     try:
-        data = urllib.parse.urlencode(sync_data).encode('utf-8')
-        req = urllib.request.Request(
-            "https://trustsmartcloud2.com/ics2000_api/gateway.php",
-            data=data,
-            method='POST'
-        )
-        
-        with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
-            sync_text = response.read().decode('utf-8')
-            sync_response = json.loads(sync_text)
-            
-            # Get device names
-            for module_data in sync_response[:20]:  # First 20 devices
-                module_id = module_data.get('id')
-                
-                # Try to get name
-                name = f"Device {module_id}"
-                encrypted_data = module_data.get('data')
-                if encrypted_data:
-                    decrypted = decrypt_field(encrypted_data, aes_key_hex)
-                    if decrypted and 'module' in decrypted:
-                        name = decrypted['module'].get('name', name)
-                
-                devices.append((module_id, name))
-            
-            print(f"\nAvailable devices (first 20):")
-            for i, (dev_id, name) in enumerate(devices):
-                print(f"  {i+1}. {name} (ID: {dev_id})")
-            
+        # Keep this sync around; it doubles as the initial state
+        modules = fetch_modules(sync_body)
     except Exception as e:
         print(f"❌ Error: {e}")
         return
     
-    # Select device to monitor
-    choice = input("\nSelect device number to monitor: ").strip()
-    try:
-        idx = int(choice) - 1
-        module_id, device_name = devices[idx]
-    except:
-        print("Invalid selection")
-        return
+    if args.module_id is not None:
+        # A module ID on the command line skips decrypting the device list
+        module_id = args.module_id
+        if module_id not in modules:
+            print(f"❌ Unknown module ID: {module_id}")
+            return
+        device_name = get_device_name(modules[module_id], aes_key)
+    else:
+        # Get device names
+        devices = [
+            (module_data.get('id'), get_device_name(module_data, aes_key))
+            for module_data in itertools.islice(modules.values(), 20)  # First 20 devices
+        ]
+        
+        print(f"\nAvailable devices (first 20):")
+        for i, (dev_id, name) in enumerate(devices):
+            print(f"  {i+1}. {name} (ID: {dev_id})")
+        
+        # Select device to monitor
+        choice = input("\nSelect device number to monitor: ").strip()
+        try:
+            idx = int(choice) - 1
+            module_id, device_name = devices[idx]
+        except:
+            print("Invalid selection")
+            return
     
     print(f"\n📍 Monitoring: {device_name} (ID: {module_id})")
     print("="*60)
     
     # Get initial state
     print("\n1. Getting initial state...")
-    before = get_module_data(email, password, home_id, gateway_mac, module_id)
+    before = modules.get(str(module_id))
     
     if not before:
         print("❌ Couldn't get device data")
@@ -204,14 +193,14 @@ def main():
     print("Initial data captured:")
     print(f"  version_status: {before.get('version_status')}")
     print(f"  version_data: {before.get('version_data')}")
-    print(f"  status hash: {hashlib.md5(before.get('status', '').encode()).hexdigest()[:8]}")
-    print(f"  data hash: {hashlib.md5(before.get('data', '').encode()).hexdigest()[:8]}")
+    print(f"  status crc32: {zlib.crc32(before.get('status', '').encode()):08x}")
+    print(f"  data crc32: {zlib.crc32(before.get('data', '').encode()):08x}")
     
     # Decrypt to show current content
     if before.get('status'):
-        status_decrypted = decrypt_field(before['status'], aes_key_hex)
+        status_decrypted = decrypt_field(before['status'], aes_key)
         if status_decrypted:
-            print(f"  status content: {json.dumps(status_decrypted, separators=(',', ':'))[:100]}")
+            print(f"  status content: {compact_json(status_decrypted)[:100]}")
     
     print("\n" + "="*60)
     print("ACTION REQUIRED:")
@@ -222,7 +211,11 @@ def main():
     print("3. Wait a few seconds")
     print("4. Press Enter here to check for changes")
     
-    input("\nPress Enter after changing device state...")
+    if args.auto:
+        print(f"\nWaiting {args.wait:g} seconds for the state change...")
+        time.sleep(args.wait)
+    else:
+        input("\nPress Enter after changing device state...")
     
     # Check for changes
     print("\n2. Checking for changes...")
@@ -234,55 +227,36 @@ def main():
         print(f"\nAttempt {attempt + 1}/3...")
         time.sleep(2)  # Wait 2 seconds between attempts
         
-        after = get_module_data(email, password, home_id, gateway_mac, module_id)
+        after = get_module_data(sync_body, module_id)
         
         if not after:
             print("❌ Couldn't get device data")
             continue
         
-        # Compare versions
-        version_changed = False
-        if before.get('version_status') != after.get('version_status'):
-            print(f"✅ version_status changed: {before.get('version_status')} → {after.get('version_status')}")
-            version_changed = True
-            changes_found = True
-        
-        if before.get('version_data') != after.get('version_data'):
-            print(f"✅ version_data changed: {before.get('version_data')} → {after.get('version_data')}")
-            version_changed = True
-            changes_found = True
+        # Compare all tracked fields in one pass
+        changed = [field for field in TRACKED_FIELDS if before.get(field) != after.get(field)]
         
-        # Compare encrypted data
-        if before.get('status') != after.get('status'):
-            print(f"✅ 'status' field changed!")
-            
-            # Decrypt both to see what changed
-            before_decrypted = decrypt_field(before['status'], aes_key_hex)
-            after_decrypted = decrypt_field(after['status'], aes_key_hex)
+        for field in changed:
+            if field not in ENCRYPTED_PREVIEW:
+                print(f"✅ {field} changed: {before.get(field)} → {after.get(field)}")
+                continue
             
-            if before_decrypted and after_decrypted:
-                print(f"  Before: {json.dumps(before_decrypted, separators=(',', ':'))}")
-                print(f"  After:  {json.dumps(after_decrypted, separators=(',', ':'))}")
-            
-            changes_found = True
-        
-        if before.get('data') != after.get('data'):
-            print(f"✅ 'data' field changed!")
+            print(f"✅ '{field}' field changed!")
             
             # Decrypt both to see what changed
-            before_decrypted = decrypt_field(before['data'], aes_key_hex)
-            after_decrypted = decrypt_field(after['data'], aes_key_hex)
+            before_decrypted = decrypt_field(before.get(field), aes_key)
+            after_decrypted = decrypt_field(after.get(field), aes_key)
             
             if before_decrypted and after_decrypted:
-                print(f"  Before: {json.dumps(before_decrypted, separators=(',', ':'))[:200]}")
-                print(f"  After:  {json.dumps(after_decrypted, separators=(',', ':'))[:200]}")
-            
-            changes_found = True
+                limit = ENCRYPTED_PREVIEW[field]
+                print(f"  Before: {compact_json(before_decrypted)[:limit]}")
+                print(f"  After:  {compact_json(after_decrypted)[:limit]}")
         
-        if changes_found:
+        if changed:
+            changes_found = True
             break
-        else:
-            print("  No changes detected yet...")
+        
+        print("  No changes detected yet...")
     
     print("\n" + "="*60)
     print("RESULTS:")
@@ -305,4 +279,7 @@ def main():
     print("Zigbee devices might show state changes, while 433MHz won't.")
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        close_connections()
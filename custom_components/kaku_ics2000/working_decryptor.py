@@ -5,68 +5,137 @@ The data uses AES CBC with zero IV, but the JSON starts after the first block
 """
 
 import json
-import base64
+from binascii import a2b_base64
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 
+try:
+    from Crypto.Cipher import AES as CryptodomeAES
+    from Crypto.Util._cpu_features import have_aes_ni
+except ImportError:  # PyCryptodome is optional
+    CryptodomeAES = None
+
+# Pick the AES backend once at import. PyCryptodome only has a hardware path
+# for AES-NI; without it use cryptography, where OpenSSL picks AES-NI or
+# ARMv8 Crypto Extensions itself
+AES_BACKEND = 'pycryptodome' if CryptodomeAES is not None and have_aes_ni() else 'cryptography'
+
+_DECODER = json.JSONDecoder()
+
+# Zero IV used by the ICS-2000 for AES-CBC
+_ZERO_IV = b'\x00' * 16
+
+_BACKEND = default_backend()
+
+# Valid PKCS7 padding tails, indexed by pad length
+_PKCS7_PADDING = tuple(bytes((n,)) * n for n in range(17))
+
+@lru_cache(maxsize=8)
+def _get_aes_decrypt(aes_key_hex: str) -> Callable[[bytes], bytes]:
+    """Build the AES CBC (zero IV) decrypt function for a key once and reuse it."""
+    aes_key = bytes.fromhex(aes_key_hex)
+    
+    if AES_BACKEND == 'pycryptodome':
+        # PyCryptodome calls straight into its AES-NI routine
+        def aes_decrypt(encrypted: bytes) -> bytes:
+            return CryptodomeAES.new(aes_key, CryptodomeAES.MODE_CBC, iv=_ZERO_IV).decrypt(encrypted)
+        
+        return aes_decrypt
+    
+    cipher = Cipher(algorithms.AES(aes_key), modes.CBC(_ZERO_IV), backend=_BACKEND)
+    
+    def aes_decrypt(encrypted: bytes) -> bytes:
+        # Each call needs a fresh decryptor for the CBC state. Unpadded CBC
+        # leaves nothing for finalize(), so skip concatenating its empty result
+        decryptor = cipher.decryptor()
+        decrypted = decryptor.update(encrypted)
+        decryptor.finalize()
+        return decrypted
+    
+    return aes_decrypt
+
 def decrypt_kaku_data(encrypted_b64: str, aes_key_hex: str):
     """Decrypt KlikAanKlikUit data."""
     
     # Convert inputs
-    aes_key = bytes.fromhex(aes_key_hex)
-    encrypted = base64.b64decode(encrypted_b64)
+    encrypted = a2b_base64(encrypted_b64)
     
     # Decrypt using AES CBC with zero IV
-    iv = b'\x00' * 16
-    cipher = Cipher(algorithms.AES(aes_key), modes.CBC(iv), backend=default_backend())
+    decrypted = _get_aes_decrypt(aes_key_hex)(encrypted)
+    
+    return _parse_plaintext(decrypted)
+
+def make_kaku_decryptor(aes_key_hex: str) -> Callable[[str], Any]:
+    """Return a decrypt function bound to one key, for decrypting many messages."""
+    aes_decrypt = _get_aes_decrypt(aes_key_hex)
+    
+    def decrypt(encrypted_b64: str):
+        return _parse_plaintext(aes_decrypt(a2b_base64(encrypted_b64)))
+    
+    return decrypt
+
+def decrypt_kaku_batch(encrypted_blobs: Iterable[str], aes_key_hex: str) -> List:
+    """Decrypt several blobs that share one key, looking the key up only once."""
+    decrypt = make_kaku_decryptor(aes_key_hex)
+    return [decrypt(blob) for blob in encrypted_blobs]
+
+def decrypt_kaku_data_ctr(encrypted_b64: str, aes_key_hex: str, nonce: bytes):
+    """Decrypt KlikAanKlikUit data encrypted with AES CTR instead of CBC."""
+    
+    # The ICS-2000 payloads seen so far are CBC with zero IV (decrypt_kaku_data);
+    # this is for probing flows that may use CTR. The nonce is the 16 byte counter block
+    encrypted = a2b_base64(encrypted_b64)
+    
+    cipher = Cipher(algorithms.AES(bytes.fromhex(aes_key_hex)), modes.CTR(nonce), backend=_BACKEND)
     decryptor = cipher.decryptor()
     decrypted = decryptor.update(encrypted) + decryptor.finalize()
     
-    # Find where JSON starts (usually after first block at position 16)
-    json_start = -1
-    for i in range(len(decrypted)):
-        if decrypted[i:i+1] in [b'{', b'[']:
-            json_start = i
-            break
+    return _parse_plaintext(decrypted)
+
+def _parse_plaintext(decrypted: bytes):
+    """Extract the JSON value from decrypted KlikAanKlikUit data."""
+    
+    # Find where JSON starts; it usually follows the first block at position 16
+    if decrypted[16:17] in (b'{', b'['):
+        json_start = 16
+    else:
+        starts = [pos for pos in (decrypted.find(b'{'), decrypted.find(b'[')) if pos >= 0]
+        json_start = min(starts, default=-1)
     
     if json_start < 0:
         print("No JSON found in decrypted data")
         return None
     
-    # Extract JSON part
-    json_bytes = decrypted[json_start:]
-    
-    # Remove padding if present
-    if len(json_bytes) > 0:
-        # Check last byte for PKCS7 padding
-        pad_len = json_bytes[-1]
-        if pad_len < 16:
-            # Verify it's valid padding
-            if all(b == pad_len for b in json_bytes[-pad_len:]):
-                json_bytes = json_bytes[:-pad_len]
-    
-    # Decode and parse
-    json_text = json_bytes.decode('utf-8', errors='ignore')
-    
-    # Find the end of JSON (remove any trailing garbage)
-    depth = 0
-    json_end = 0
-    for i, char in enumerate(json_text):
-        if char == '{':
-            depth += 1
-        elif char == '}':
-            depth -= 1
-            if depth == 0:
-                json_end = i + 1
-                break
-    
-    if json_end > 0:
-        json_text = json_text[:json_end]
-    
-    return json.loads(json_text)
+    # Remove padding if present by moving the end index instead of copying
+    json_end = len(decrypted)
+    
+    # Check last byte for PKCS7 padding and verify the whole tail in one compare
+    pad_len = decrypted[-1]
+    if 0 < pad_len <= 16 and decrypted.endswith(_PKCS7_PADDING[pad_len]):
+        json_end -= pad_len
+    
+    # Decode the JSON part straight from a memoryview, without slicing copies.
+    # Strict decoding keeps CPython's ASCII fast path; bad bytes mean a bad key
+    try:
+        json_text = str(memoryview(decrypted)[json_start:json_end], 'utf-8')
+    except UnicodeDecodeError as e:
+        print(f"Invalid UTF-8 in decrypted data: {e}")
+        return None
+
+    # Parse up to the end of the JSON value, ignoring any trailing garbage
+    try:
+        data, _ = _DECODER.raw_decode(json_text)
+    except json.JSONDecodeError as e:
+        print(f"Invalid JSON in decrypted data: {e}")
+        return None
+    
+    return data
 
 def main():
     print("=== KlikAanKlikUit Device Decryptor ===\n")
+    print(f"AES backend: {AES_BACKEND}\n")
     
     # Your data
     aes_key_hex = "f27089bd7728f1899d8aabeacacf8d13"
@@ -74,8 +143,10 @@ def main():
     encrypted_status = "rO1UhRri1NsdqgRGLOMd6Xnt08JKaGyalJHfxivRlHIgBb+BBvico1g+61eBj8KT72Yt/bpUR0NC6j4Or9VyTA=="
     encrypted_data = "5OO/DACQWmrMdUtvSe7E8W7wFwzmoyNbdbevK/YWvTHAxSNf/Jdp1/1qjapiAVDagBZ1XyXXwaL/iwUUjllzB3oStLeKxsBW8mrmW04ynXDBdmz0+p4gsiLNarxbW79Al9IEobQPkW7g7+00Uu39SnuLXNH9AWzwwQbMKSv/OuM8Mf7KzH4PL9pGrpn0v5iSBfir4fkA4RfSZJAvDuM9IVkTpFVHXZcK7cmXW7pT7HuSAMkiXrNyIBktK5Kj+dhM/mcETjOlhp3nxh0B+9/t6ygRhPtBcchmnR5dvT+nso0="
     
+    # Both blobs use the same key, so decrypt them together
+    status, data = decrypt_kaku_batch((encrypted_status, encrypted_data), aes_key_hex)
+    
     print("Decrypting Status...")
-    status = decrypt_kaku_data(encrypted_status, aes_key_hex)
     if status:
         print("✅ Status decrypted successfully!")
         print(json.dumps(status, indent=2))
@@ -83,7 +154,6 @@ def main():
     print("\n" + "="*50 + "\n")
     
     print("Decrypting Data...")
-    data = decrypt_kaku_data(encrypted_data, aes_key_hex)
     if data:
         print("✅ Data decrypted successfully!")
         print(json.dumps(data, indent=2))
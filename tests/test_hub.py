@@ -0,0 +1,110 @@
+"""Tests for the ICS-2000 hub helpers."""
+
+import pytest
+
+from custom_components.kaku_ics2000.const import (
+    DEVICE_TYPE_COVER,
+    DEVICE_TYPE_DIMMER,
+    DEVICE_TYPE_LIGHT,
+    DEVICE_TYPE_SENSOR,
+    DEVICE_TYPE_SWITCH,
+)
+from custom_components.kaku_ics2000.hub import (
+    DeviceRecord,
+    ICS2000Hub,
+    _guess_device_type_cached,
+)
+
+
+@pytest.mark.parametrize(
+    ("device_name", "device_value", "expected"),
+    [
+        # Keyword priority wins over word order: sensor > dimmer > light > cover > switch
+        ("Ledstrip plug", 0, DEVICE_TYPE_LIGHT),
+        ("Dimmable lamp", 0, DEVICE_TYPE_DIMMER),
+        ("Dimmer-switch kitchen light", 0, DEVICE_TYPE_DIMMER),
+        ("Hallway light (dimmable)", 0, DEVICE_TYPE_DIMMER),
+        ("Motion light", 0, DEVICE_TYPE_SENSOR),
+        ("Living room blinds", 0, DEVICE_TYPE_COVER),
+        ("Garden socket", 0, DEVICE_TYPE_SWITCH),
+        # No keyword: fall back to the module device value
+        ("Unit 7", 2, DEVICE_TYPE_DIMMER),
+        ("Unit 7", 4, DEVICE_TYPE_DIMMER),
+        ("Unit 7", 1, DEVICE_TYPE_SWITCH),
+    ],
+)
+def test_guess_device_type(device_name, device_value, expected):
+    """Device type guesses match the original keyword priority order."""
+    assert _guess_device_type_cached(device_name, device_value) == expected
+
+
+@pytest.mark.parametrize(
+    ("option", "expected"),
+    [
+        # Options flow TextSelector: one comma-separated string
+        ("12345", {12345}),
+        ("12,34", {12, 34}),
+        (" 12 , 34 ,, abc", {12, 34}),
+        ("", set()),
+        # List form, with int or string entries
+        ([12, "34", " 56 "], {12, 34, 56}),
+        ([], set()),
+        (None, set()),
+    ],
+)
+def test_entity_blacklist_option_shapes(option, expected):
+    """The blacklist accepts a comma-separated string or a list of IDs."""
+    hub = ICS2000Hub.__new__(ICS2000Hub)
+    hub.entity_blacklist = option
+    assert hub.entity_blacklist == frozenset(expected)
+
+
+def _make_record() -> DeviceRecord:
+    return DeviceRecord(
+        device_id=6,
+        device_type=DEVICE_TYPE_SWITCH,
+        device_model="Garden socket",
+        dimmable=False,
+    )
+
+
+@pytest.mark.parametrize("key", ["last_command", "confidence"])
+def test_device_record_unset_field_is_missing(key):
+    """Fields never set read like absent dict keys."""
+    record = _make_record()
+    assert key not in record
+    assert record.get(key) is None
+    assert record.get(key, 90) == 90
+    with pytest.raises(KeyError):
+        record[key]
+
+
+def test_device_record_none_field_is_present():
+    """A field holding None reads like a dict key with a None value."""
+    record = _make_record()
+    assert record.brightness is None
+    assert "brightness" in record
+    assert record.get("brightness", 50) is None
+    assert record["brightness"] is None
+
+
+def test_device_record_unknown_key():
+    """Keys that are not fields are missing."""
+    record = _make_record()
+    assert "color_temperature" not in record
+    assert record.get("color_temperature", "x") == "x"
+    with pytest.raises(KeyError):
+        record["color_temperature"]
+
+
+def test_device_record_setitem():
+    """Item assignment sets fields and rejects keys that are not fields."""
+    record = _make_record()
+    record["last_command"] = "on"
+    record["state"] = True
+    assert "last_command" in record
+    assert record["last_command"] == "on"
+    assert record.state is True
+    
+    with pytest.raises(KeyError):
+        record["color_temperature"] = 3000